@@ -1,12 +1,28 @@
+import os
+import threading
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
+from tkinter import ttk, messagebox, filedialog
+import numpy as np
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+from comparison import compare_algorithms
+from gantt_view import GanttView
+from instrumentation import RunProfiler
+from process_table import VirtualTable
+from quantum_sweep import search_quantum
+from result_cache import ResultCache
+from results import PERCENTILES, export_binary, export_csv
+from scheduling import POLICIES, Cancelled, RoundRobinScheduler, RunProgress
+from smp import simulate_smp
+from workload import Workload, load_workload
 
 class SchedulerGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("CPU Scheduling")
-        self.root.geometry("1130x600")
+        self.root.geometry("1130x700")
         self.Gui()
 
     def Gui(self):
@@ -20,34 +36,53 @@ class SchedulerGUI:
         # Algorithm Dropdown
         tk.Label(self.input_frame, text="Algorithm", font=("Arial", 12)).grid(row=1, column=0, sticky="w", pady=(10, 2))
         self.algorithm_var = tk.StringVar(value="First Come First Serve, FCFS")
-        algorithms = [
-            "First Come First Serve, FCFS",
-            "Shortest Job First, SJF",
-            "Shortest Remaining Time First, SRTF",
-            "Priority Scheduling (Preemptive)",
-            "Priority Scheduling (Non-Preemptive)",
-            "Round Robin, RR",
-        ]
+        algorithms = list(POLICIES)
         self.algorithm_dropdown = ttk.Combobox(self.input_frame, textvariable=self.algorithm_var, values=algorithms)
         self.algorithm_dropdown.grid(row=1, column=1, columnspan=2, sticky="ew", pady=5)
         self.algorithm_dropdown.bind("<<ComboboxSelected>>", self.update_table_columns)
 
+        # Number of CPUs and, for more than one, shared or per-core run queues
+        cpu_frame = tk.Frame(self.input_frame)
+        cpu_frame.grid(row=1, column=3, sticky="w", padx=5)
+        tk.Label(cpu_frame, text="CPUs:").pack(side=tk.LEFT)
+        self.cpus_var = tk.IntVar(value=1)
+        tk.Spinbox(cpu_frame, from_=1, to=1024, width=5, textvariable=self.cpus_var).pack(side=tk.LEFT)
+        self.per_core_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(cpu_frame, text="Per-core queues", variable=self.per_core_var).pack(side=tk.LEFT)
+
         # Number of Processes Section
         tk.Label(self.input_frame, text="Number of Processes:", font=("Arial", 12)).grid(row=2, column=0, sticky="w", padx=5)
         self.num_processes_var = tk.IntVar()
         tk.Entry(self.input_frame, textvariable=self.num_processes_var).grid(row=2, column=1, padx=5, sticky="ew")
         tk.Button(self.input_frame, text="Set", command=self.set_process_inputs).grid(row=2, column=2, padx=5)
+        tk.Button(self.input_frame, text="Load Trace...", command=self.load_trace).grid(row=2, column=3, padx=5)
 
         # Process Input Frame
         self.process_input_frame = tk.Frame(self.input_frame)
-        self.process_input_frame.grid(row=3, column=0, columnspan=3, sticky="w", pady=10)
+        self.process_input_frame.grid(row=3, column=0, columnspan=4, sticky="nsew", pady=10)
+        self.input_frame.rowconfigure(3, weight=1)
 
         self.include_priority_column = False
         self.include_quantum_time = False
+        self.workload = None
+        self.result = None
+        self.worker = None
+        # Solve reuses earlier runs of unchanged workloads; set SCHEDULER_CACHE_DIR to keep them on disk
+        self.cache = ResultCache(directory=os.environ.get("SCHEDULER_CACHE_DIR"))
 
-        # Solve Button
+        # Solve and Cancel Buttons
         self.solve_button = tk.Button(self.input_frame, text="Solve", font=("Arial", 12, "bold"), bg="blue", fg="white", command=self.solve)
-        self.solve_button.grid(row=5, column=0, columnspan=3, pady=20)
+        self.solve_button.grid(row=5, column=0, pady=(20, 5))
+        self.compare_button = tk.Button(self.input_frame, text="Compare All", font=("Arial", 12), command=self.compare_all)
+        self.compare_button.grid(row=5, column=1, pady=(20, 5))
+        self.cancel_button = tk.Button(self.input_frame, text="Cancel", font=("Arial", 12), state=tk.DISABLED, command=self.cancel)
+        self.cancel_button.grid(row=5, column=2, pady=(20, 5))
+        self.export_button = tk.Button(self.input_frame, text="Export...", font=("Arial", 12), state=tk.DISABLED, command=self.export_results)
+        self.export_button.grid(row=5, column=3, pady=(20, 5))
+
+        # Progress of the running simulation
+        self.progress_bar = ttk.Progressbar(self.input_frame, mode="determinate", maximum=100)
+        self.progress_bar.grid(row=6, column=0, columnspan=3, sticky="ew")
 
         # Output Frame
         output_frame = tk.Frame(self.root, padx=5, pady=20)
@@ -55,22 +90,29 @@ class SchedulerGUI:
 
         tk.Label(output_frame, text="Output", font=("Arial", 16, "bold")).pack(anchor="w")
 
-        self.output_text = tk.Text(output_frame, height=20, wrap=tk.WORD)
-        self.output_text.pack(fill=tk.BOTH, expand=True)
+        self.gantt_view = GanttView(output_frame)
+        self.gantt_view.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
+
+        self.results_table = VirtualTable(output_frame, [
+            ("Process", 90), ("Arrival Time", 90), ("Burst Time", 90), ("Turnaround Time", 110), ("Waiting Time", 90),
+        ], height=8)
+        self.results_table.pack(fill=tk.BOTH, expand=True)
+
+        self.output_text = tk.Text(output_frame, height=7, wrap=tk.WORD)
+        self.output_text.pack(fill=tk.X, pady=(5, 0))
 
     def update_table_columns(self, event=None):
-        selected_algorithm = self.algorithm_var.get()
-        self.include_priority_column = selected_algorithm in [
-            "Priority Scheduling (Preemptive)",
-            "Priority Scheduling (Non-Preemptive)",
-        ]
+        policy = POLICIES[self.algorithm_var.get()]
+        self.include_priority_column = policy.needs_priority
 
         if hasattr(self, "quantum_label"):
             self.quantum_label.destroy()
         if hasattr(self, "quantum_entry"):
             self.quantum_entry.destroy()
+        if hasattr(self, "sweep_button"):
+            self.sweep_button.destroy()
 
-        if selected_algorithm == "Round Robin, RR":
+        if policy.needs_quantum:
             self.include_quantum_time = True
             self.quantum_label = tk.Label(self.input_frame, text="Quantum Time:")
             self.quantum_label.grid(row=4, column=0, sticky="w", padx=5)
@@ -78,10 +120,28 @@ class SchedulerGUI:
             self.quantum_var = tk.IntVar()
             self.quantum_entry = tk.Entry(self.input_frame, textvariable=self.quantum_var)
             self.quantum_entry.grid(row=4, column=1, padx=5, sticky="ew")
+
+            if policy is RoundRobinScheduler:  # The sweep tunes Round Robin only
+                self.sweep_button = tk.Button(self.input_frame, text="Find Best", command=self.sweep_quantum)
+                self.sweep_button.grid(row=4, column=2, padx=5)
         else:
             self.include_quantum_time = False
 
-        self.set_process_inputs()
+        if self.workload is not None:
+            self.show_process_table()
+
+    def load_trace(self):
+        path = filedialog.askopenfilename(
+            title="Load Trace",
+            filetypes=[("Trace files", "*.csv *.jsonl *.ndjson"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            self.workload = load_workload(path)
+            self.num_processes_var.set(len(self.workload))
+            self.show_process_table()
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not load {path}: {e}")
 
     def set_process_inputs(self):
         try:
@@ -89,401 +149,304 @@ class SchedulerGUI:
             if n <= 0:
                 raise ValueError("Number of processes must be greater than zero.")
 
-            for widget in self.process_input_frame.winfo_children():
-                widget.destroy()
-
-            tk.Label(self.process_input_frame, text="Process Name").grid(row=0, column=0, padx=5)
-            tk.Label(self.process_input_frame, text="Arrival Time").grid(row=0, column=1, padx=5)
-            tk.Label(self.process_input_frame, text="Burst Time").grid(row=0, column=2, padx=5)
-
-            if self.include_priority_column:
-                tk.Label(self.process_input_frame, text="Priority").grid(row=0, column=3, padx=5)
-
-            self.process_inputs = []
-            for i in range(n):
-                process_name = tk.Entry(self.process_input_frame)
-                arrival_time = tk.Entry(self.process_input_frame)
-                burst_time = tk.Entry(self.process_input_frame)
-
-                process_name.grid(row=i + 1, column=0, padx=5, pady=2)
-                arrival_time.grid(row=i + 1, column=1, padx=5, pady=2)
-                burst_time.grid(row=i + 1, column=2, padx=5, pady=2)
-
-                if self.include_priority_column:
-                    priority = tk.Entry(self.process_input_frame)
-                    priority.grid(row=i + 1, column=3, padx=5, pady=2)
-                    self.process_inputs.append((process_name, arrival_time, burst_time, priority))
-                else:
-                    self.process_inputs.append((process_name, arrival_time, burst_time))
+            # Start from default rows; cells are edited in place in the table
+            self.workload = Workload(np.zeros(n), np.ones(n), names=[f"P{i + 1}" for i in range(n)])
+            self.show_process_table()
 
         except ValueError as e:
             messagebox.showerror("Error", str(e))
 
+    def show_process_table(self):
+        if self.include_priority_column and self.workload.priority is None:
+            self.workload.priority = np.zeros(len(self.workload), dtype=np.int64)
+
+        for widget in self.process_input_frame.winfo_children():
+            widget.destroy()
+
+        columns = [("Process Name", 110), ("Arrival Time", 90), ("Burst Time", 90)]
+        if self.include_priority_column:
+            columns.append(("Priority", 70))
+
+        self.process_table = VirtualTable(self.process_input_frame, columns, on_edit=self.edit_process)
+        self.process_table.pack(fill=tk.BOTH, expand=True)
+        self.process_table.set_source(len(self.workload), self.process_row)
+
+    def process_row(self, i):
+        workload = self.workload
+        row = (workload.name(i), int(workload.arrival[i]), int(workload.burst[i]))
+        if self.include_priority_column:
+            row += (int(workload.priority[i]),)
+        return row
+
+    def edit_process(self, i, column, text):
+        if self.worker is not None:
+            raise ValueError("Wait for the running simulation to finish before editing.")
+        workload = self.workload
+        if column == 0:
+            process_name = text.strip()
+            if not process_name:
+                raise ValueError("Process names cannot be empty.")
+            workload.names[i] = process_name
+            self.workload_changed()
+            return
+
+        try:
+            value = int(text)
+        except ValueError:
+            raise ValueError(f"'{text}' is not a whole number.")
+
+        if column == 1:
+            workload.arrival[i] = value
+        elif column == 2:
+            if value < 0:
+                raise ValueError("Burst times cannot be negative.")
+            workload.burst[i] = value
+        else:
+            workload.priority[i] = value
+        self.workload_changed()
+
+    def workload_changed(self):
+        # The last result shares the edited arrays, so it can no longer be exported
+        self.workload.changed()
+        self.result = None
+        self.export_button.config(state=tk.DISABLED)
+
+    def read_run_inputs(self):
+        if self.workload is None:
+            raise ValueError("Set the number of processes or load a trace first.")
+        quantum_time = None
+        if self.include_quantum_time:
+            quantum_time = int(self.quantum_var.get())
+        return self.workload, quantum_time
+
     def solve(self):
+        if self.worker is not None:
+            return
         try:
             algorithm = self.algorithm_var.get()
-            process_names = []
-            arrival_times = []
-            burst_times = []
-            priorities = []
-
-            for inputs in self.process_inputs:
-                process_name = inputs[0].get().strip()
-                if not process_name:
-                    raise ValueError("Process names cannot be empty.")
-                process_names.append(process_name)
-
-                arrival_time = int(inputs[1].get())
-                burst_time = int(inputs[2].get())
-                arrival_times.append(arrival_time)
-                burst_times.append(burst_time)
-
-                if self.include_priority_column:
-                    priority = int(inputs[3].get())
-                    priorities.append(priority)
-
-            if self.include_quantum_time:
-                quantum_time = int(self.quantum_var.get())
-
-            if algorithm == "First Come First Serve, FCFS":
-                self.fcfs(process_names, arrival_times, burst_times)
-            elif algorithm == "Shortest Job First, SJF":
-                self.sjf(process_names, arrival_times, burst_times)
-            elif algorithm=="Shortest Remaining Time First, SRTF":
-                self.srtf(process_names, arrival_times, burst_times)
-            elif algorithm == "Priority Scheduling (Preemptive)":
-                self.priority_preemptive(process_names, arrival_times, burst_times, priorities)  
-            elif algorithm=="Priority Scheduling (Non-Preemptive)":
-                self.priority_non_preemptive(process_names, arrival_times, burst_times, priorities) 
-            elif algorithm=="Round Robin, RR":
-                self.round_robin(process_names, arrival_times, burst_times, quantum_time)     
-        except ValueError as e:
+            workload, quantum_time = self.read_run_inputs()
+            cpus = int(self.cpus_var.get())
+        except (ValueError, tk.TclError) as e:
             self.output_text.delete("1.0", tk.END)
             self.output_text.insert(tk.END, f"Error: {e}")
+            return
+
+        if cpus > 1:
+            shared_queue = not self.per_core_var.get()
+            self.start_worker(lambda progress: simulate_smp(algorithm, workload, cpus, quantum_time, shared_queue, progress),
+                              self.show_result, "processes completed")
+            return
+
+        # SCHEDULER_PROFILE=<path prefix> profiles every run that misses the cache
+        profile_path = os.environ.get("SCHEDULER_PROFILE")
+        profile = RunProfiler(profile_path) if profile_path else None
+        self.start_worker(lambda progress: self.cache.schedule(algorithm, workload, quantum_time, progress, profile),
+                          self.show_result, "processes completed")
+
+    def compare_all(self):
+        if self.worker is not None:
+            return
+        try:
+            workload, quantum_time = self.read_run_inputs()
+        except (ValueError, tk.TclError) as e:
+            self.output_text.delete("1.0", tk.END)
+            self.output_text.insert(tk.END, f"Error: {e}")
+            return
 
-    def fcfs(self, process_names, arrival_times, burst_times):
-        processes = sorted(zip(process_names, arrival_times, burst_times), key=lambda x: x[1])  # Sort by arrival time
-        gantt_chart = []
-        time = 0
-
-        # Initialize metrics
-        turnaround_times = []
-        waiting_times = []
-
-        for process_name, arrival_time, burst_time in processes:
-            if time < arrival_time:
-                time = arrival_time  # Wait until the process arrives
-            start_time = time
-            time += burst_time
-            end_time = time
-
-            # Calculate turnaround and waiting times
-            turnaround_time = end_time - arrival_time
-            waiting_time = turnaround_time - burst_time
-
-            turnaround_times.append(turnaround_time)
-            waiting_times.append(waiting_time)
-
-            gantt_chart.append((process_name, start_time, end_time))
-
-        # Calculate averages
-        avg_turnaround_time = sum(turnaround_times) / len(turnaround_times)
-        avg_waiting_time = sum(waiting_times) / len(waiting_times)
-
-        # Display Gantt chart and results
-        self.plot_gantt_chart(gantt_chart, "FCFS Scheduling")
-        self.display_results(processes, turnaround_times, waiting_times, avg_turnaround_time, avg_waiting_time)
-
-    def sjf(self, process_names, arrival_times, burst_times):
-        processes = sorted(zip(process_names, arrival_times, burst_times), key=lambda x: (x[1], x[2]))  # Sort by arrival time, then burst time
-        gantt_chart = []
-        time = 0
-        completed = []
-
-        # Initialize metrics
-        turnaround_times = []
-        waiting_times = []
-
-        while len(completed) < len(processes):
-            available_processes = [p for p in processes if p[1] <= time and p not in completed]
-            if available_processes:
-                current_process = min(available_processes, key=lambda x: x[2])  # Select process with shortest burst time
-                process_name, arrival_time, burst_time = current_process
-                start_time = time
-                time += burst_time
-                end_time = time
-
-                # Calculate turnaround and waiting times
-                turnaround_time = end_time - arrival_time
-                waiting_time = turnaround_time - burst_time
-
-                turnaround_times.append(turnaround_time)
-                waiting_times.append(waiting_time)
-
-                gantt_chart.append((process_name, start_time, end_time))
-                completed.append(current_process)
-            else:
-                time += 1  # Increment time if no process is available
-
-        # Calculate averages
-        avg_turnaround_time = sum(turnaround_times) / len(turnaround_times)
-        avg_waiting_time = sum(waiting_times) / len(waiting_times)
-
-        # Display Gantt chart and results
-        self.plot_gantt_chart(gantt_chart, "SJF Scheduling")
-        self.display_results(processes, turnaround_times, waiting_times, avg_turnaround_time, avg_waiting_time)
-
-    def srtf(self, process_names, arrival_times, burst_times):
-
-        processes = list(zip(process_names, arrival_times, burst_times))
-        n = len(processes)
-        remaining_times = {name: burst for name, _, burst in processes}
-        completed = 0
-        time = 0
-        gantt_chart = []
-        turnaround_times = {name: 0 for name in process_names}
-        waiting_times = {name: 0 for name in process_names}
-        while completed < n:
-            available = [(name, remaining_times[name]) for name, arrival, _ in processes if arrival <= time and remaining_times[name] > 0]
-            if available:
-                available.sort(key=lambda x: x[1])  # Sort by remaining time
-                current_process = available[0][0]
-
-                gantt_chart.append((current_process, time, time + 1))  # Process runs for 1 unit time
-                remaining_times[current_process] -= 1
-                time += 1
-
-                if remaining_times[current_process] == 0:
-                    completed += 1
-                    end_time = time
-                    arrival_time = next(arrival for name, arrival, _ in processes if name == current_process)
-                    burst_time = next(burst for name, _, burst in processes if name == current_process)
-
-                    turnaround_times[current_process] = end_time - arrival_time
-                    waiting_times[current_process] = turnaround_times[current_process] - burst_time
-            else:
-                time += 1  # Idle time
+        self.start_worker(lambda progress: compare_algorithms(workload, quantum_time, progress=progress),
+                          self.show_comparison, "algorithms finished")
 
-        # Calculate averages
-        avg_turnaround_time = sum(turnaround_times.values()) / n
-        avg_waiting_time = sum(waiting_times.values()) / n
+    def sweep_quantum(self):
+        if self.worker is not None:
+            return
+        if self.workload is None:
+            self.output_text.delete("1.0", tk.END)
+            self.output_text.insert(tk.END, "Error: Set the number of processes or load a trace first.")
+            return
+
+        workload = self.workload
+        self.start_worker(lambda progress: search_quantum(workload, progress=progress),
+                          self.show_sweep, "quanta evaluated")
+
+    def export_results(self):
+        if self.worker is not None or self.result is None:
+            return
+        path = filedialog.asksaveasfilename(
+            title="Export Results", defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("NumPy archives", "*.npz")])
+        if not path:
+            return
+
+        result = self.result
+        if path.lower().endswith(".npz"):
+            task = lambda progress: export_binary(result, path)
+        else:
+            # Gantt segments go next to the metrics, e.g. results.csv and results_gantt.csv
+            segments_path = os.path.splitext(path)[0] + "_gantt.csv"
+            task = lambda progress: export_csv(result, path, segments_path, progress)
+        self.start_worker(task, lambda _: self.output_text.insert(tk.END, f"Exported to {path}"), "rows written")
+
+    def start_worker(self, task, on_done, unit):
+        # Run task(progress) on a worker thread; poll_worker hands its value to on_done
+        self.progress = RunProgress()
+        self.progress_unit = unit
+        self.worker_outcome = None
+        self.worker_done = on_done
+        self.worker = threading.Thread(target=self.run_worker, args=(task, self.progress), daemon=True)
+        self.solve_button.config(state=tk.DISABLED)
+        self.compare_button.config(state=tk.DISABLED)
+        self.export_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.progress_bar["value"] = 0
+        self.output_text.delete("1.0", tk.END)
+        self.output_text.insert(tk.END, "Running...")
+        self.worker.start()
+        self.root.after(100, self.poll_worker)
 
-        # Consolidate Gantt chart
-        consolidated_gantt = []
-        for name, start, end in gantt_chart:
-            if consolidated_gantt and consolidated_gantt[-1][0] == name:
-                consolidated_gantt[-1] = (name, consolidated_gantt[-1][1], end)
+    def run_worker(self, task, progress):
+        # Runs off the Tk thread, so it must not touch any widget
+        try:
+            self.worker_outcome = ("done", task(progress))
+        except Cancelled:
+            self.worker_outcome = ("cancelled", None)
+        except Exception as e:
+            self.worker_outcome = ("error", e)
+
+    def poll_worker(self):
+        progress = self.progress
+        if self.worker.is_alive():
+            if progress.total:
+                self.progress_bar["value"] = 100 * progress.completed / progress.total
+            self.output_text.delete("1.0", tk.END)
+            if progress.cancelled:
+                self.output_text.insert(tk.END, "Cancelling...")
             else:
-                consolidated_gantt.append((name, start, end))
-
-        # Display Gantt chart and results
-        self.plot_gantt_chart(consolidated_gantt, "SRTF Scheduling")
-        self.display_results([(name, arrival, burst) for name, arrival, burst in processes],list(turnaround_times.values()),list(waiting_times.values()), avg_turnaround_time, avg_waiting_time)        
-    
-    def priority_preemptive(self, process_names, arrival_times, burst_times, priorities):
-     processes = list(zip(process_names, arrival_times, burst_times, priorities))
-     remaining_times = {p[0]: p[2] for p in processes}  # Remaining burst times
-     gantt_chart = []
-     time = 0
-     completed = 0
-     n = len(processes)
-
-     # Initialize metrics
-     turnaround_times = {p[0]: 0 for p in processes}
-     waiting_times = {p[0]: 0 for p in processes}
-     end_times = {}
-
-     while completed < n:
-        available_processes = [p for p in processes if p[1] <= time and remaining_times[p[0]] > 0]
-        if not available_processes:
-            time += 1
-            continue
-
-        highest_priority_process = min(available_processes, key=lambda x: (x[3], x[1]))
-        process_name, arrival_time, _, _ = highest_priority_process
-
-        if gantt_chart and gantt_chart[-1][0] == process_name:
-            gantt_chart[-1] = (process_name, gantt_chart[-1][1], time + 1)
-        else:
-            gantt_chart.append((process_name, time, time + 1))
-
-        remaining_times[process_name] -= 1
-        time += 1
-
-        if remaining_times[process_name] == 0:
-            completed += 1
-            end_times[process_name] = time
-            turnaround_times[process_name] = end_times[process_name] - arrival_time
-            waiting_times[process_name] = turnaround_times[process_name] - burst_times[process_names.index(process_name)]
-
-     # Calculate averages
-     avg_turnaround_time = sum(turnaround_times.values()) / n
-     avg_waiting_time = sum(waiting_times.values()) / n
-
-     # Display Gantt chart and results
-     self.plot_gantt_chart(gantt_chart, "Priority Preemptive Scheduling")
-     self.display_results(
-        [(name, arrival, burst) for name, arrival, burst in zip(process_names, arrival_times, burst_times)],
-        list(turnaround_times.values()),
-        list(waiting_times.values()),
-        avg_turnaround_time,
-        avg_waiting_time )
-     
-    def priority_non_preemptive(self, process_names, arrival_times, burst_times, priorities):
-     # Combine process data into tuples
-     processes = list(zip(process_names, arrival_times, burst_times, priorities))
-     gantt_chart = []
-     time = 0
-     completed = 0
-     n = len(processes)
-
-     # Initialize metrics
-     turnaround_times = {p[0]: 0 for p in processes}
-     waiting_times = {p[0]: 0 for p in processes}
-     end_times = {}
-
-     # While not all processes are completed
-     while completed < n:
-        # Get processes that have arrived and are not completed
-        available_processes = [p for p in processes if p[1] <= time and p[0] not in end_times]
-        if not available_processes:
-            time += 1  # Increment time if no process is available
-            continue
-
-        # Select process with the highest priority (lowest priority value)
-        highest_priority_process = min(available_processes, key=lambda x: (x[3], x[1]))
-        process_name, arrival_time, burst_time, _ = highest_priority_process
-
-        # Record the start and end time of the process
-        start_time = max(time, arrival_time)
-        time = start_time + burst_time
-        end_time = time
-        gantt_chart.append((process_name, start_time, end_time))
-
-        # Calculate metrics
-        end_times[process_name] = end_time
-        turnaround_times[process_name] = end_time - arrival_time
-        waiting_times[process_name] = turnaround_times[process_name] - burst_time
-
-        completed += 1  # Mark the process as completed
-
-     # Calculate average turnaround and waiting times
-     avg_turnaround_time = sum(turnaround_times.values()) / n
-     avg_waiting_time = sum(waiting_times.values()) / n
-
-     # Display Gantt chart and results
-     self.plot_gantt_chart(gantt_chart, "Priority Non-Preemptive Scheduling")
-     self.display_results(
-        [(name, arrival, burst) for name, arrival, burst in zip(process_names, arrival_times, burst_times)],
-        list(turnaround_times.values()),
-        list(waiting_times.values()),
-        avg_turnaround_time,
-        avg_waiting_time)
-
-    def round_robin(self, process_names, arrival_times, burst_times, quantum_time):
-     # Initialize processes sorted by arrival time
-     processes = list(zip(process_names, arrival_times, burst_times))
-     processes.sort(key=lambda p: p[1])  # Sort by arrival time
-
-     remaining_times = {p[0]: p[2] for p in processes}  # Remaining burst times
-     arrival_dict = {p[0]: p[1] for p in processes}     # Arrival times
-
-     time = 0
-     queue = []  # Ready queue
-     gantt_chart = []
-     turnaround_times = {}
-     waiting_times = {}
-
-     i = 0  # Index to track arriving processes
-
-     # Initially add processes that have arrived at time 0
-     while i < len(processes) and processes[i][1] <= time:
-        queue.append(processes[i][0])
-        i += 1
-
-     # Main execution loop
-     while queue or i < len(processes):
-        if not queue:  # If the queue is empty, jump to the next arriving process
-            time = processes[i][1]
-            queue.append(processes[i][0])
-            i += 1
-
-        process_name = queue.pop(0)
-
-        # Execute process for quantum time or remaining time
-        executed_time = min(quantum_time, remaining_times[process_name])
-        start_time = time
-        time += executed_time
-        end_time = time
-
-        # Update Gantt chart
-        gantt_chart.append((process_name, start_time, end_time))
-        remaining_times[process_name] -= executed_time
-
-        # Add newly arrived processes to the queue
-        while i < len(processes) and processes[i][1] <= time:
-            queue.append(processes[i][0])
-            i += 1
-
-        # Re-add current process if it still has remaining burst time
-        if remaining_times[process_name] > 0:
-            queue.append(process_name)
-        else:
-            # Process completed, calculate turnaround and waiting times
-            turnaround_times[process_name] = time - arrival_dict[process_name]
-            waiting_times[process_name] = turnaround_times[process_name] - burst_times[process_names.index(process_name)]
-
-     # Calculate average turnaround and waiting times
-     avg_turnaround_time = sum(turnaround_times.values()) / len(processes)
-     avg_waiting_time = sum(waiting_times.values()) / len(processes)
-
-     # Plot Gantt Chart
-     self.plot_gantt_chart(gantt_chart, "Round Robin Scheduling")
-
-     # Display results
-     self.display_results(
-        [(name, arrival, burst) for name, arrival, burst in processes],
-        list(turnaround_times.values()),
-        list(waiting_times.values()),
-        avg_turnaround_time,
-        avg_waiting_time
-     )
-
-
-
-    def plot_gantt_chart(self, gantt_chart, title):
-
-        process_names = [item[0] for item in gantt_chart]
-        start_times = [item[1] for item in gantt_chart]
-        end_times = [item[2] for item in gantt_chart]
-        durations = [end - start for start, end in zip(start_times, end_times)]
-
-        fig, ax = plt.subplots(figsize=(12, 2))
-        for i, (process, start, duration) in enumerate(zip(process_names, start_times, durations)):
-            ax.barh(0, duration, left=start, color='skyblue', edgecolor="black", height=0.3)
-            ax.text(start + duration / 2, 0, process, va='center', ha='center', color="black", fontsize=8)
-
-        ax.set_yticks([])
-        ax.set_yticklabels([])
-        ax.set_xlim(0, max(end_times) + 1)
-        ax.set_title(title, pad=10)
-        ax.set_xlabel('Time')
-        ax.grid(True, axis='x', linestyle='--', linewidth=0.5, alpha=0.7)
-        plt.tight_layout()
-        plt.show()
-
-    def display_results(self, processes, turnaround_times, waiting_times, avg_turnaround_time, avg_waiting_time):
-        output = ""
-        output += "Process\tArrival Time\t\tBurst Time\t\tTurnaround Time\t\tWaiting Time\n"
-        for i, process in enumerate(processes):
-            output += f"{process[0]}\t\t{process[1]}\t\t{process[2]}\t\t{turnaround_times[i]}\t\t{waiting_times[i]}\n"
-
-        output += f"\nAverage Turnaround Time: {avg_turnaround_time:.2f}\n"
-        output += f"Average Waiting Time: {avg_waiting_time:.2f}\n"
+                self.output_text.insert(tk.END, f"Running... {progress.completed} of {progress.total} {self.progress_unit}")
+            self.root.after(100, self.poll_worker)
+            return
+
+        self.worker = None
+        self.solve_button.config(state=tk.NORMAL)
+        self.compare_button.config(state=tk.NORMAL)
+        self.export_button.config(state=tk.NORMAL if self.result is not None else tk.DISABLED)
+        self.cancel_button.config(state=tk.DISABLED)
+        self.output_text.delete("1.0", tk.END)
 
+        status, value = self.worker_outcome
+        if status == "done":
+            self.progress_bar["value"] = 100
+            self.worker_done(value)
+        elif status == "cancelled":
+            self.progress_bar["value"] = 0
+            self.output_text.insert(tk.END, "Cancelled.")
+        else:
+            self.progress_bar["value"] = 0
+            self.output_text.insert(tk.END, f"Error: {value}")
+
+    def cancel(self):
+        if self.worker is not None:
+            self.progress.cancel()
+
+    def show_result(self, result):
+        self.result = result
+        self.export_button.config(state=tk.NORMAL)
+        start = time.perf_counter()
+        self.plot_gantt_chart(result)
+        self.display_results(result)
+        self.root.update_idletasks()  # Include the deferred canvas draw
+        result.timings["rendering"] = time.perf_counter() - start
+
+        timings = result.timings
+        simulation = f"{timings['simulation'] * 1000:.1f} ms" if "simulation" in timings else "cached"
+        self.output_text.insert(tk.END, f"Time: simulation {simulation}, metrics {timings['metrics'] * 1000:.1f} ms, "
+                                        f"rendering {timings['rendering'] * 1000:.1f} ms")
+
+    def show_sweep(self, sweep):
+        self.quantum_var.set(sweep.best_quantum)
+        self.output_text.insert(tk.END, f"Best quantum: {sweep.best_quantum} "
+                                        f"(average waiting time {sweep.best_avg_waiting_time:.2f}, "
+                                        f"average turnaround time {sweep.best_avg_turnaround_time:.2f})")
+
+        window = tk.Toplevel(self.root)
+        window.title("Round Robin Quantum Sweep")
+        figure = Figure(figsize=(7, 4), dpi=100)
+        ax = figure.add_subplot()
+        ax.plot(sweep.quanta, sweep.avg_waiting_times, marker=".", label="Average waiting time")
+        ax.plot(sweep.quanta, sweep.avg_turnaround_times, marker=".", label="Average turnaround time")
+        ax.axvline(sweep.best_quantum, color="gray", linestyle="--", linewidth=1, label=f"Best quantum = {sweep.best_quantum}")
+        ax.set_xlabel("Quantum")
+        ax.set_ylabel("Time")
+        ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.7)
+        ax.legend()
+        figure.tight_layout()
+
+        canvas = FigureCanvasTkAgg(figure, master=window)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        canvas.draw()
+
+    def show_comparison(self, summaries):
+        window = tk.Toplevel(self.root)
+        window.title("Algorithm Comparison")
+
+        columns = [
+            ("Algorithm", 230, None),
+            ("Avg TAT", 80, "avg_turnaround_time"), ("p95 TAT", 80, "p95_turnaround_time"), ("Max TAT", 80, "max_turnaround_time"),
+            ("Avg WT", 80, "avg_waiting_time"), ("p95 WT", 80, "p95_waiting_time"), ("Max WT", 80, "max_waiting_time"),
+            ("Context Switches", 110, "context_switches"), ("CPU Utilization", 100, "cpu_utilization"),
+        ]
+        tree = ttk.Treeview(window, columns=[f"c{i}" for i in range(len(columns))], show="headings", height=len(summaries))
+        for i, (heading, width, _) in enumerate(columns):
+            tree.heading(f"c{i}", text=heading)
+            tree.column(f"c{i}", width=width, anchor="w" if i == 0 else "center")
+
+        for algorithm, summary in summaries.items():
+            row = [algorithm]
+            for _, _, key in columns[1:]:
+                value = summary[key]
+                if key == "cpu_utilization":
+                    row.append(f"{value:.1%}")
+                elif isinstance(value, float):
+                    row.append(f"{value:.2f}")
+                else:
+                    row.append(value)
+            tree.insert("", tk.END, values=row)
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        skipped = [algorithm for algorithm in POLICIES if algorithm not in summaries]
+        if skipped:
+            tk.Label(window, text="Not run (needs priorities or a quantum): " + ", ".join(skipped),
+                     wraplength=800, justify=tk.LEFT).pack(anchor="w", padx=10, pady=(0, 10))
+
+    def plot_gantt_chart(self, result):
+        self.gantt_view.show(result)
+
+    def display_results(self, result):
+        workload = result.workload
+        turnaround_times = result.turnaround_times
+        waiting_times = result.waiting_times
+
+        # The table pulls rows on demand, so only the visible page is formatted
+        self.results_table.set_source(len(workload), lambda i: (
+            workload.name(i), int(workload.arrival[i]), int(workload.burst[i]),
+            int(turnaround_times[i]), int(waiting_times[i])))
+
+        stats = result.stats()
+        turnaround, waiting = result.percentiles(PERCENTILES)
+        labels = "/".join(f"p{q}" for q in PERCENTILES)
+        output = (f"Average Turnaround Time: {result.avg_turnaround_time:.2f}\n"
+                  f"Average Waiting Time: {result.avg_waiting_time:.2f}\n"
+                  f"Turnaround {labels}: {' / '.join(f'{value:.1f}' for value in turnaround)}, "
+                  f"waiting {labels}: {' / '.join(f'{value:.1f}' for value in waiting)}\n"
+                  f"Decisions: {stats['decisions']}, context switches: {stats['context_switches']}, "
+                  f"ready queue max {stats['max_ready_queue']} / mean {stats['mean_ready_queue']:.2f}, "
+                  f"idle time: {stats['idle_time']}, CPU utilization: {stats['cpu_utilization']:.1%}\n")
+        if result.cpus > 1:
+            output += (f"CPUs: {result.cpus}, makespan: {result.makespan}, throughput: {result.throughput:.3f}/time unit, "
+                       f"per-core utilization {stats['min_core_utilization']:.1%} to {stats['max_core_utilization']:.1%}\n")
         self.output_text.delete("1.0", tk.END)
         self.output_text.insert(tk.END, output)
 
-root = tk.Tk()
-app = SchedulerGUI(root)
-root.mainloop()
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = SchedulerGUI(root)
+    root.mainloop()
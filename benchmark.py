@@ -0,0 +1,175 @@
+"""Scaling benchmark for the scheduling algorithms.
+
+Runs every algorithm on seeded synthetic workloads of increasing size and
+records wall time, peak traced memory and throughput (processes per second)
+to a JSON file, together with the run's ScheduleResult.stats() counters.
+Passing a previous results file with --baseline reports slowdowns between
+the two runs and exits with status 1 if any are found. --profile writes a
+cProfile report for every run into a directory. --cpus runs the SMP
+simulation instead, with the arrival rate scaled so that --load stays the
+utilisation of each CPU.
+
+    python benchmark.py --sizes 10 1000 100000 --output results.json
+    python benchmark.py --output new.json --baseline results.json
+    python benchmark.py --algorithms srtf --sizes 100000 --profile profiles
+    python benchmark.py --cpus 128 --per-core --sizes 1000000
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from instrumentation import RunProfiler
+from scheduling import POLICIES, schedule
+from smp import simulate_smp
+from synthetic import ARRIVAL_PROCESSES, BURST_DISTRIBUTIONS, PRIORITY_DISTRIBUTIONS, generate_workload, quantum_for
+
+# Short command-line names, e.g. "srtf" for "Shortest Remaining Time First, SRTF"
+SHORT_NAMES = {policy.short_name: name for name, policy in POLICIES.items()}
+DEFAULT_SIZES = [10, 100, 1000, 10_000, 100_000, 1_000_000]
+
+
+def measure(algorithm, workload, quantum_time, with_memory, profile_path=None, cpus=1, shared_queue=True):
+    def run():
+        if cpus > 1:
+            return simulate_smp(algorithm, workload, cpus, quantum_time, shared_queue)
+        return schedule(algorithm, workload, quantum_time)
+
+    start = time.perf_counter()
+    result = run()
+    wall_time = time.perf_counter() - start
+
+    peak_memory = None
+    if with_memory:
+        # Separate run: tracemalloc slows Python code down too much to time under it
+        tracemalloc.start()
+        run()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    if profile_path is not None:
+        RunProfiler(profile_path).run(run)
+
+    return {
+        "wall_time_s": wall_time,
+        "peak_memory_bytes": peak_memory,
+        "throughput_pps": len(workload) / wall_time if wall_time > 0 else None,
+        "segments": len(result.segments[0]),
+        **result.stats(),
+    }
+
+
+def run_benchmarks(args):
+    results = []
+    workloads = {}
+    for short_name in args.algorithms:
+        algorithm = SHORT_NAMES[short_name]
+        last = None  # (n, wall time) of the previous size
+        for n in args.sizes:
+            row = {"algorithm": short_name, "n": n}
+            if last is not None and last[1] * n / last[0] > args.max_seconds:
+                # Even linear scaling from the previous size would blow the budget
+                row["skipped"] = True
+                results.append(row)
+                print(f"{short_name:>24} n={n:<9} skipped")
+                continue
+
+            if n not in workloads:
+                workloads[n] = generate_workload(
+                    n, seed=args.seed, arrivals=args.arrivals, bursts=args.bursts, load=args.load * args.cpus,
+                    mean_burst=args.mean_burst, priority_distribution=args.priorities)
+            workload = workloads[n]
+            quantum_time = quantum_for(workload, args.quantum) if POLICIES[algorithm].needs_quantum else None
+
+            profile_path = os.path.join(args.profile, f"{short_name}-{n}") if args.profile else None
+            row.update(measure(algorithm, workload, quantum_time, args.memory and n <= args.memory_limit, profile_path,
+                               args.cpus, not args.per_core))
+            row["quantum"] = quantum_time
+            results.append(row)
+
+            memory = f"{row['peak_memory_bytes'] / 2**20:8.1f} MiB" if row["peak_memory_bytes"] is not None else "           -"
+            print(f"{short_name:>24} n={n:<9} {row['wall_time_s']:10.4f} s {memory} "
+                  f"{row['throughput_pps'] or 0:14,.0f} proc/s")
+            last = (n, row["wall_time_s"])
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print runs that got slower than baseline by more than threshold; return how many."""
+    previous = {(row["algorithm"], row["n"]): row for row in baseline["results"] if not row.get("skipped")}
+    regressions = 0
+    for row in results:
+        old = previous.get((row["algorithm"], row["n"]))
+        if row.get("skipped") or old is None:
+            continue
+        ratio = row["wall_time_s"] / old["wall_time_s"] if old["wall_time_s"] > 0 else 1.0
+        if ratio > 1 + threshold:
+            regressions += 1
+            print(f"REGRESSION {row['algorithm']} n={row['n']}: "
+                  f"{old['wall_time_s']:.4f} s -> {row['wall_time_s']:.4f} s ({ratio:.2f}x)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--algorithms", nargs="+", choices=list(SHORT_NAMES), default=list(SHORT_NAMES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arrivals", choices=ARRIVAL_PROCESSES, default="poisson")
+    parser.add_argument("--bursts", choices=BURST_DISTRIBUTIONS, default="pareto")
+    parser.add_argument("--priorities", choices=PRIORITY_DISTRIBUTIONS, default="uniform")
+    parser.add_argument("--load", type=float, default=0.9, help="offered utilisation of each CPU")
+    parser.add_argument("--mean-burst", type=int, default=10)
+    parser.add_argument("--quantum", default="p50", help='Round Robin and MLFQ quantum: an integer or a burst percentile such as "p80"')
+    parser.add_argument("--max-seconds", type=float, default=30.0,
+                        help="skip sizes predicted to take longer than this from the previous size")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip the peak memory runs")
+    parser.add_argument("--memory-limit", type=int, default=100_000, help="largest n to measure peak memory for")
+    parser.add_argument("--profile", metavar="DIR", help="also profile every run, writing <algorithm>-<n>.prof/.txt here")
+    parser.add_argument("--cpus", type=int, default=1, help="simulate this many CPUs")
+    parser.add_argument("--per-core", action="store_true", help="with --cpus, per-core queues instead of a shared one")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="earlier results file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="slowdown counted as a regression")
+    args = parser.parse_args(argv)
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+
+    results = run_benchmarks(args)
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "arrivals": args.arrivals,
+            "bursts": args.bursts,
+            "priorities": args.priorities,
+            "load": args.load,
+            "mean_burst": args.mean_burst,
+            "quantum": args.quantum,
+            "cpus": args.cpus,
+            "per_core": args.per_core,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved {len(results)} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Run every algorithm on one workload side by side.
+
+compare_algorithms sends each algorithm to its own worker process, so the
+pure-Python simulations run in parallel across cores. Workers return only
+the ScheduleResult.summary() dict, not the full schedule.
+"""
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from scheduling import POLICIES, RunProgress, schedule
+
+# Seconds between checks for a cancel while waiting for the workers
+POLL_INTERVAL = 0.1
+
+# Set in every worker by init_worker: an Event that is set to cancel the comparison
+worker_cancelled = None
+
+
+def init_worker(cancelled):
+    global worker_cancelled
+    worker_cancelled = cancelled
+
+
+class WorkerProgress(RunProgress):
+    """RunProgress of a run in a worker, cancelled through the shared event."""
+
+    def update(self, completed):
+        if worker_cancelled.is_set():
+            self.cancel()
+        super().update(completed)
+
+
+def run_summary(algorithm, workload, quantum_time):
+    return schedule(algorithm, workload, quantum_time, WorkerProgress()).summary()
+
+
+def applicable_algorithms(workload, quantum_time=None):
+    """Algorithms that can run on this workload, in POLICIES order.
+
+    Priority algorithms need priorities and Round Robin and MLFQ need a quantum.
+    """
+    algorithms = []
+    for algorithm, policy in POLICIES.items():
+        if policy.needs_priority and workload.priority is None:
+            continue
+        if policy.needs_quantum and not quantum_time:
+            continue
+        algorithms.append(algorithm)
+    return algorithms
+
+
+def compare_algorithms(workload, quantum_time=None, algorithms=None, max_workers=None, progress=None):
+    """Return {algorithm: summary dict} for every algorithm, in POLICIES order.
+
+    progress, if given, is a scheduling.RunProgress counting finished
+    algorithms. Cancelling it is noticed within POLL_INTERVAL seconds: the
+    algorithms that have not started are dropped and the running ones stop
+    at their next progress check, so no worker keeps simulating.
+    """
+    if algorithms is None:
+        algorithms = applicable_algorithms(workload, quantum_time)
+    if len(workload) == 0:
+        raise ValueError("There are no processes to schedule.")
+    if progress is not None:
+        progress.total = len(algorithms)
+
+    summaries = {}
+    cancelled = multiprocessing.Event()
+    executor = ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker, initargs=(cancelled,))
+    try:
+        futures = {executor.submit(run_summary, algorithm, workload, quantum_time): algorithm for algorithm in algorithms}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                summaries[futures[future]] = future.result()
+            if progress is not None:
+                progress.update(len(summaries))  # Raises Cancelled once cancelled
+    except BaseException:
+        # Cancelled or a failed algorithm: stop the running ones and don't wait for them
+        cancelled.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+    return {algorithm: summaries[algorithm] for algorithm in algorithms}
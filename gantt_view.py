@@ -0,0 +1,146 @@
+"""Embedded Gantt chart renderer.
+
+GanttView draws a schedule inside the Tk window with one lane per process,
+or one per CPU for multi-CPU runs (see ScheduleResult.lanes).
+All bars live in a single PolyCollection, and every time the view is
+zoomed or panned, level_of_detail() reduces the segments to what can be
+told apart at the current pixel size before they are handed to it.
+When there are more lanes than pixel rows, lanes are folded together in
+groups of a power of two with fold_lanes(); the view keeps the segments
+sorted for the current group size, so a redraw is a linear pass and only
+a zoom that changes the group size sorts again.
+"""
+import math
+import tkinter as tk
+
+import numpy as np
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+
+# Lanes are labelled with process names only when there are at most this many
+MAX_LANE_LABELS = 40
+LANE_HEIGHT = 0.8
+
+
+def lane_span_for(y_range, height_px):
+    """Lanes folded into one drawn lane: the power of two covering one pixel row."""
+    lanes_per_px = math.ceil((y_range[1] - y_range[0]) / max(height_px, 1))
+    return 1 << max(lanes_per_px - 1, 0).bit_length()
+
+
+def fold_lanes(lanes, starts, ends, lane_span):
+    """Fold lane-sorted segments into groups of lane_span lanes, sorted by group, then start.
+
+    Each group is already a few runs sorted by start, one per lane, which
+    a stable sort merges in far less than a full sort.
+    """
+    if lane_span == 1 or len(lanes) == 0:
+        return lanes, starts, ends
+    lanes = lanes // lane_span * lane_span
+    time_span = int(ends.max()) - int(starts.min()) + 1
+    if int(lanes.max()) < (2**63 - 1) // time_span:
+        order = np.argsort(lanes.astype(np.int64) * time_span + (starts - starts.min()), kind="stable")
+    else:
+        order = np.lexsort((starts, lanes))
+    return lanes[order], starts[order], ends[order]
+
+
+def level_of_detail(lanes, starts, ends, x_range, y_range, width_px, lane_span=1):
+    """Reduce sorted segments to those worth drawing at this zoom.
+
+    lanes, starts and ends must be sorted by lane, then start, with lanes
+    folded in groups of lane_span as by fold_lanes(). Segments outside
+    x_range / y_range are dropped, and within a lane, segments separated
+    by less than one pixel are merged. The result is bounded by the number
+    of pixels, not the number of segments, and the cost is one pass.
+
+    Returns (lanes, starts, ends).
+    """
+    x0, x1 = x_range
+    y0, y1 = y_range
+    visible = (ends > x0) & (starts < x1) & (lanes > math.floor(y0) - lane_span) & (lanes <= math.ceil(y1))
+    lanes, starts, ends = lanes[visible], starts[visible], ends[visible]
+    if len(lanes) == 0:
+        return lanes, starts, ends
+
+    px = (x1 - x0) / max(width_px, 1)
+    new_run = np.ones(len(lanes), dtype=bool)
+    new_run[1:] = (lanes[1:] != lanes[:-1]) | (starts[1:] - ends[:-1] >= px)
+    first = np.flatnonzero(new_run)
+    return lanes[first], starts[first], np.maximum.reduceat(ends, first)
+
+
+class GanttView(tk.Frame):
+    """Gantt chart canvas with the standard matplotlib zoom/pan toolbar."""
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.figure = Figure(figsize=(6, 2.5), dpi=100)
+        self.ax = self.figure.add_subplot()
+        self.ax.set_xlabel("Time")
+        self.ax.grid(True, axis="x", linestyle="--", linewidth=0.5, alpha=0.7)
+
+        self.collection = PolyCollection([], facecolors="skyblue", edgecolors="black", linewidths=0.3)
+        self.ax.add_collection(self.collection)
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self)
+        self.toolbar = NavigationToolbar2Tk(self.canvas, self, pack_toolbar=False)
+        self.toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+
+        self.lanes = self.starts = self.ends = np.empty(0, dtype=np.int64)
+        self.lane_count = 0
+        self.folded = (1, self.lanes, self.starts, self.ends)  # (lane_span, lanes, starts, ends) last drawn
+        self.redraw_pending = False
+        self.ax.callbacks.connect("xlim_changed", self.schedule_redraw)
+        self.ax.callbacks.connect("ylim_changed", self.schedule_redraw)
+        self.canvas.mpl_connect("resize_event", self.schedule_redraw)
+
+    def show(self, result):
+        _, starts, ends = result.segments
+        lanes, self.lane_count = result.lanes()
+        order = np.lexsort((starts, lanes))  # Lane by lane, in time order
+        self.lanes, self.starts, self.ends = lanes[order], starts[order], ends[order]
+        self.folded = (1, self.lanes, self.starts, self.ends)
+
+        ax = self.ax
+        ax.set_title(result.title, pad=10)
+        if self.lane_count <= MAX_LANE_LABELS:
+            ax.set_yticks(range(self.lane_count))
+            ax.set_yticklabels([result.lane_label(lane) for lane in range(self.lane_count)], fontsize=8)
+        else:
+            ax.set_yticks([])
+        end = int(self.ends.max()) if len(self.ends) else 0
+        ax.set_xlim(0, end + 1)
+        ax.set_ylim(self.lane_count - 0.5, -0.5)  # First lane at the top
+        self.toolbar.update()  # Home goes back to this view
+        self.redraw()
+
+    def schedule_redraw(self, *args):
+        # Zooming changes both limits; redraw once when Tk is idle
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.after_idle(self.redraw)
+
+    def redraw(self):
+        self.redraw_pending = False
+        ax = self.ax
+        bbox = ax.get_window_extent()
+        y_low, y_high = sorted(ax.get_ylim())
+        lane_span = lane_span_for((y_low, y_high), bbox.height)
+        if lane_span != self.folded[0]:
+            # Sort once per group size; panning and zooming within it reuse the order
+            self.folded = (lane_span, *fold_lanes(self.lanes, self.starts, self.ends, lane_span))
+        lanes, starts, ends = level_of_detail(*self.folded[1:], ax.get_xlim(), (y_low, y_high), bbox.width, lane_span)
+
+        # A folded lane covers lane_span process lanes starting at its own
+        low = lanes - 0.5 + (1 - LANE_HEIGHT) / 2
+        high = lanes - 0.5 + lane_span - (1 - LANE_HEIGHT) / 2
+        verts = np.empty((len(lanes), 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = starts
+        verts[:, 2, 0] = verts[:, 3, 0] = ends
+        verts[:, 0, 1] = verts[:, 3, 1] = low
+        verts[:, 1, 1] = verts[:, 2, 1] = high
+        self.collection.set_verts(verts)
+        self.canvas.draw_idle()
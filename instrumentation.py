@@ -0,0 +1,79 @@
+"""Per-run statistics and opt-in profiling.
+
+The counters in ScheduleResult.stats() are derived from the finished
+schedule with a few vectorized passes, so the simulation loops carry no
+bookkeeping for them and they can stay on in batch runs. RunProfiler is
+the opposite: an explicit, expensive hook that runs a single schedule
+under cProfile (and optionally tracemalloc) and writes the reports to disk.
+"""
+import cProfile
+import pstats
+import tracemalloc
+
+import numpy as np
+
+
+def ready_queue_stats(result):
+    """(max, time-weighted mean) number of processes waiting for the CPU.
+
+    The ready queue only grows when a process arrives or a slice ends, so
+    its maximum is found by evaluating arrived - completed - running right
+    after every arrival and segment boundary. The mean follows from
+    Little's law: the queue length integrated over time is the total
+    waiting time.
+    """
+    _, starts, ends = result.segments
+    busy = ends > starts
+    run_starts, run_ends = np.sort(starts[busy]), np.sort(ends[busy])
+    arrivals = np.sort(result.workload.arrival)
+    completions = np.sort(result.end_times)
+
+    points = np.concatenate([arrivals, run_starts, run_ends])
+    arrived = np.searchsorted(arrivals, points, side="right")
+    completed = np.searchsorted(completions, points, side="right")
+    # Segments started minus segments ended, so this works for any number of CPUs
+    running = np.searchsorted(run_starts, points, side="right") - np.searchsorted(run_ends, points, side="right")
+    lengths = arrived - completed - running
+
+    makespan = result.makespan
+    mean = float(result.waiting_times.sum() / makespan) if makespan > 0 else 0.0
+    return int(lengths.max()), mean
+
+
+class RunProfiler:
+    """Opt-in profiling of a single run, passed as profile= to schedule().
+
+    The run executes under cProfile; the raw profile is written to
+    path + ".prof" (for pstats or snakeviz) and a readable report of the
+    top functions to path + ".txt". With memory=True it also runs under
+    tracemalloc and the report lists the peak and the largest allocation
+    sites. tracemalloc slows Python code down a lot, so the timings in a
+    memory profile are only good for comparing functions with each other.
+    """
+
+    def __init__(self, path, memory=False, top=30):
+        self.path = path
+        self.memory = memory
+        self.top = top
+
+    def run(self, function, *args, **kwargs):
+        profiler = cProfile.Profile()
+        if self.memory:
+            tracemalloc.start()
+        try:
+            result = profiler.runcall(function, *args, **kwargs)
+            if self.memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                snapshot = tracemalloc.take_snapshot()
+        finally:
+            if self.memory:
+                tracemalloc.stop()
+
+        profiler.dump_stats(self.path + ".prof")
+        with open(self.path + ".txt", "w") as f:
+            pstats.Stats(profiler, stream=f).sort_stats("cumulative").print_stats(self.top)
+            if self.memory:
+                f.write(f"Peak traced memory: {peak / 2**20:.1f} MiB\n\n")
+                for stat in snapshot.statistics("lineno")[:self.top]:
+                    f.write(f"{stat}\n")
+        return result
@@ -0,0 +1,149 @@
+"""Virtualized table widget for large process lists.
+
+A VirtualTable is a ttk.Treeview that only ever holds one item per visible
+row. Scrolling changes which model rows those items show instead of
+inserting an item per row, so building and scrolling the table costs the
+same for ten processes or a million.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+
+class VirtualTable(ttk.Frame):
+    """Treeview showing rows get_row(0) .. get_row(row_count - 1).
+
+    columns is a list of (heading, width) pairs. When on_edit is given, a
+    double-click opens an entry over the cell and on_edit(row, column, text)
+    is called with the new text; it may raise ValueError to reject it.
+    """
+
+    def __init__(self, master, columns, height=15, on_edit=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.height = height
+        self.on_edit = on_edit
+        self.row_count = 0
+        self.get_row = None
+        self.offset = 0
+        self.editor = None
+
+        column_ids = [f"c{i}" for i in range(len(columns))]
+        self.tree = ttk.Treeview(self, columns=column_ids, show="headings", height=height, selectmode="browse")
+        for column_id, (heading, width) in zip(column_ids, columns):
+            self.tree.heading(column_id, text=heading)
+            self.tree.column(column_id, width=width, anchor="center", stretch=True)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        # One reusable item per visible row
+        for k in range(height):
+            self.tree.insert("", tk.END, iid=str(k))
+        self.attached = height
+
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", lambda event: self.scroll(-3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll(3))
+        self.tree.bind("<Up>", self.on_arrow)
+        self.tree.bind("<Down>", self.on_arrow)
+        self.tree.bind("<Prior>", lambda event: self.scroll(-self.height) or "break")
+        self.tree.bind("<Next>", lambda event: self.scroll(self.height) or "break")
+        if on_edit is not None:
+            self.tree.bind("<Double-1>", self.begin_edit)
+
+    def set_source(self, row_count, get_row):
+        self.row_count = row_count
+        self.get_row = get_row
+        self.offset = 0
+        self.refresh()
+
+    def refresh(self):
+        self.cancel_edit()
+        visible = max(0, min(self.height, self.row_count - self.offset))
+
+        # Detach the items past the last row instead of deleting them
+        for k in range(visible, self.attached):
+            self.tree.detach(str(k))
+        for k in range(self.attached, visible):
+            self.tree.move(str(k), "", k)
+        self.attached = visible
+
+        for k in range(visible):
+            self.tree.item(str(k), values=self.get_row(self.offset + k))
+
+        if self.row_count:
+            self.scrollbar.set(self.offset / self.row_count, (self.offset + visible) / self.row_count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def scroll(self, rows):
+        offset = max(0, min(self.offset + rows, self.row_count - self.height))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.scroll(int(float(args[1]) * self.row_count) - self.offset)
+        elif args[0] == "scroll":
+            step = self.height if args[2] == "pages" else 1
+            self.scroll(int(args[1]) * step)
+
+    def on_mousewheel(self, event):
+        self.scroll(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def on_arrow(self, event):
+        # Scroll when the selection would move past the first or last visible row
+        selection = self.tree.selection()
+        if not selection:
+            return None
+        k = int(selection[0])
+        if event.keysym == "Up" and k == 0:
+            self.scroll(-1)
+            return "break"
+        if event.keysym == "Down" and k == self.attached - 1:
+            self.scroll(1)
+            return "break"
+        return None
+
+    def begin_edit(self, event):
+        item = self.tree.identify_row(event.y)
+        column = self.tree.identify_column(event.x)
+        if not item or not column:
+            return
+        bbox = self.tree.bbox(item, column)
+        if not bbox:
+            return
+
+        self.cancel_edit()
+        row = self.offset + int(item)
+        column_index = int(column[1:]) - 1
+        x, y, width, height = bbox
+
+        self.editor = ttk.Entry(self.tree)
+        self.editor.insert(0, self.tree.set(item, column))
+        self.editor.select_range(0, tk.END)
+        self.editor.place(x=x, y=y, width=width, height=height)
+        self.editor.focus_set()
+        self.editor.bind("<Return>", lambda e: self.commit_edit(row, column_index))
+        self.editor.bind("<FocusOut>", lambda e: self.commit_edit(row, column_index))
+        self.editor.bind("<Escape>", lambda e: self.cancel_edit())
+
+    def commit_edit(self, row, column_index):
+        if self.editor is None:
+            return
+        text = self.editor.get()
+        self.cancel_edit()
+        try:
+            self.on_edit(row, column_index, text)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+        self.refresh()
+
+    def cancel_edit(self):
+        if self.editor is not None:
+            editor, self.editor = self.editor, None
+            editor.destroy()
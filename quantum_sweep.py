@@ -0,0 +1,116 @@
+"""Round Robin quantum sweep and optimum search.
+
+sweep_quantum runs Round Robin for every quantum in a list, spread over a
+process pool. The workload is sent to each worker once, through the pool
+initializer, together with its cached arrival order, so every run in a
+worker reuses the same sorted order. search_quantum evaluates a coarse
+geometric grid of quanta first and then refines around the best one, which
+finds the optimum with far fewer runs than trying every value.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from scheduling import check_workload, round_robin
+
+# Workload of the current worker process, set by init_worker
+worker_workload = None
+
+
+def init_worker(workload):
+    global worker_workload
+    worker_workload = workload
+
+
+def evaluate_quantum(quantum_time):
+    result = round_robin(worker_workload, quantum_time)
+    return quantum_time, result.avg_turnaround_time, result.avg_waiting_time, result.context_switches
+
+
+class SweepResult:
+    """Average turnaround/waiting time and context switches per quantum.
+
+    All lists are sorted by quantum. The best quantum has the lowest average
+    waiting time (and so the lowest average turnaround time, which differs
+    from it by the constant mean burst); ties go to the larger quantum,
+    which needs fewer context switches.
+    """
+
+    def __init__(self, evaluations):
+        rows = sorted(evaluations.values())
+        self.quanta = [row[0] for row in rows]
+        self.avg_turnaround_times = [row[1] for row in rows]
+        self.avg_waiting_times = [row[2] for row in rows]
+        self.context_switches = [row[3] for row in rows]
+
+        best = min(range(len(rows)), key=lambda k: (self.avg_waiting_times[k], -self.quanta[k]))
+        self.best_quantum = self.quanta[best]
+        self.best_avg_turnaround_time = self.avg_turnaround_times[best]
+        self.best_avg_waiting_time = self.avg_waiting_times[best]
+
+
+class QuantumEvaluator:
+    """Process pool holding one workload, evaluating quanta on demand."""
+
+    def __init__(self, workload, max_workers=None, progress=None):
+        check_workload(workload)
+        workload.arrival_order()  # Sort once here; workers get the cached order
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=init_worker, initargs=(workload,))
+        self.progress = progress
+        self.evaluations = {}
+
+    def evaluate(self, quanta):
+        quanta = sorted({int(q) for q in quanta if q > 0} - self.evaluations.keys())
+        if self.progress is not None:
+            self.progress.total = len(self.evaluations) + len(quanta)
+        chunksize = max(1, len(quanta) // (4 * self.max_workers))
+        for row in self.executor.map(evaluate_quantum, quanta, chunksize=chunksize):
+            self.evaluations[row[0]] = row
+            if self.progress is not None:
+                self.progress.update(len(self.evaluations))
+        return quanta
+
+    def close(self, wait=True):
+        self.executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+def run_evaluator(workload, max_workers, progress, search):
+    evaluator = QuantumEvaluator(workload, max_workers, progress)
+    try:
+        search(evaluator)
+    except BaseException:
+        evaluator.close(wait=False)
+        raise
+    evaluator.close()
+    return SweepResult(evaluator.evaluations)
+
+
+def sweep_quantum(workload, quanta, max_workers=None, progress=None):
+    """Evaluate Round Robin at every quantum in quanta and return a SweepResult."""
+    return run_evaluator(workload, max_workers, progress, lambda evaluator: evaluator.evaluate(quanta))
+
+
+def search_quantum(workload, low=1, high=None, points=16, max_workers=None, progress=None):
+    """Search [low, high] for the quantum with the lowest average waiting time.
+
+    high defaults to the longest burst, past which every quantum behaves
+    like FCFS. Each round evaluates up to points quanta spread over the
+    interval between the best quantum's evaluated neighbours, until every
+    integer quantum next to the best has been tried.
+    """
+    if high is None:
+        high = max(int(workload.burst.max()), low)
+
+    def search(evaluator):
+        grid = np.unique(np.geomspace(low, high, points).round().astype(np.int64))
+        while evaluator.evaluate(grid):
+            best = SweepResult(evaluator.evaluations).best_quantum
+            tried = sorted(evaluator.evaluations)
+            k = tried.index(best)
+            left = tried[k - 1] if k > 0 else low
+            right = tried[k + 1] if k + 1 < len(tried) else high
+            grid = np.unique(np.linspace(left, right, points).round().astype(np.int64))
+
+    return run_evaluator(workload, max_workers, progress, search)
@@ -0,0 +1,111 @@
+"""Memoized scheduling runs.
+
+ResultCache sits in front of scheduling.schedule. Runs are keyed on a
+content hash of the workload (names, arrivals, bursts, priorities), the
+algorithm and the quantum, so an unchanged workload is never scheduled
+twice with the same settings. Results live in an in-memory LRU tier
+bounded by bytes and, optionally, in a directory that survives restarts
+and can be shared by batch jobs. There each result is a small .npz of
+its title and end times next to a .npy of its segments written by
+segments.save_segments, which is memory-mapped rather than read when the
+result is loaded again.
+"""
+import hashlib
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from scheduling import POLICIES, ScheduleResult, schedule
+from segments import load_segments, save_segments
+
+
+def cache_key(algorithm, workload, quantum_time):
+    if algorithm not in POLICIES or not POLICIES[algorithm].needs_quantum:
+        quantum_time = None  # The quantum only matters to the policies that take one
+    settings = f"{algorithm}\0{quantum_time}".encode()
+    return hashlib.blake2b(workload.fingerprint().encode() + b"\0" + settings, digest_size=20).hexdigest()
+
+
+class ResultCache:
+    """Two-tier cache of schedules.
+
+    Only the schedule itself (title, end times and Gantt segments) is kept;
+    on a hit it is re-attached to the caller's workload. max_bytes bounds
+    the memory tier, evicting least recently used entries first. When
+    directory is given, every result is also written there and memory
+    misses are looked up on disk.
+    """
+
+    def __init__(self, max_bytes=256 * 2**20, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.entries = OrderedDict()  # key -> (title, end_times, segments, size)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def schedule(self, algorithm, workload, quantum_time=None, progress=None, profile=None):
+        """scheduling.schedule, answered from the cache when possible.
+
+        A cached result has no "simulation" timing, and is not profiled.
+        """
+        key = cache_key(algorithm, workload, quantum_time)
+        entry = self.get(key)
+        if entry is not None:
+            self.hits += 1
+            title, end_times, segments = entry
+            if progress is not None:
+                progress.total = len(workload)
+                progress.update(len(workload))
+            return ScheduleResult(title, workload, end_times, segments)
+
+        self.misses += 1
+        result = schedule(algorithm, workload, quantum_time, progress, profile)
+        self.put(key, result.title, result.end_times, result.segments)
+        return result
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key][:3]
+        if self.directory is not None:
+            path = self.path(key)
+            if os.path.exists(path):
+                with np.load(path) as data:
+                    entry = (str(data["title"]), data["end_times"], load_segments(self.path(key, ".npy")))
+                self.remember(key, *entry)
+                return entry
+        return None
+
+    def put(self, key, title, end_times, segments):
+        self.remember(key, title, end_times, segments)
+        if self.directory is not None:
+            # The .npz goes last, so readers never see a half-written entry
+            temporary = self.path(key, ".tmp.npy")
+            save_segments(temporary, segments)
+            os.replace(temporary, self.path(key, ".npy"))
+            temporary = self.path(key, ".tmp.npz")
+            np.savez(temporary, title=title, end_times=end_times)
+            os.replace(temporary, self.path(key))
+
+    def remember(self, key, title, end_times, segments):
+        size = end_times.nbytes + sum(column.nbytes for column in segments)
+        if size > self.max_bytes:
+            return  # Would evict everything else; leave it to the disk tier
+        if key in self.entries:
+            self.size -= self.entries.pop(key)[3]
+        self.entries[key] = (title, end_times, segments, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= evicted[3]
+
+    def path(self, key, extension=".npz"):
+        return os.path.join(self.directory, key + extension)
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
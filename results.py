@@ -0,0 +1,106 @@
+"""Results stage: percentiles and export of finished schedules.
+
+export_csv writes the per-process metrics and the Gantt segments a chunk
+at a time, so memory stays bounded and a RunProgress can follow (and
+cancel) the export. export_binary stores the same data as an uncompressed
+.npz archive of integer columns, each in the narrowest dtype that holds
+it, with the Gantt segments next to it in the .npy file format of
+segments.save_segments, e.g. results.npz and results_gantt.npy. Both are
+written and read back at disk speed; load_binary turns them back into a
+ScheduleResult whose segments are memory-mapped. Multi-CPU results also
+keep the CPU of every segment, as a cpu column in the CSV and as the
+cores array in the archive, and load back as an smp.SMPResult.
+"""
+import csv
+import os
+
+import numpy as np
+
+from scheduling import ScheduleResult
+from segments import load_segments, narrowest, save_segments
+from smp import SMPResult
+from workload import Workload
+
+PERCENTILES = (50, 95, 99)
+CHUNK_SIZE = 65536
+
+
+def metric_rows(result, start, stop):
+    workload = result.workload
+    names = workload.names[start:stop]
+    priorities = workload.priority[start:stop].tolist() if workload.priority is not None else [""] * (stop - start)
+    return zip(names, workload.arrival[start:stop].tolist(), workload.burst[start:stop].tolist(), priorities,
+               result.end_times[start:stop].tolist(), result.turnaround_times[start:stop].tolist(),
+               result.waiting_times[start:stop].tolist())
+
+
+def segment_rows(result, start, stop):
+    ids, starts, ends = result.segments
+    names = result.workload.names
+    rows = ((names[i], s, e) for i, s, e in zip(ids[start:stop].tolist(), starts[start:stop].tolist(), ends[start:stop].tolist()))
+    if isinstance(result, SMPResult):
+        return (row + (c,) for row, c in zip(rows, result.cores[start:stop].tolist()))
+    return rows
+
+
+def export_csv(result, metrics_path, segments_path=None, progress=None):
+    """Write per-process metrics, and optionally the Gantt segments, as CSV.
+
+    progress, if given, is a scheduling.RunProgress counting written rows.
+    """
+    n = len(result.workload)
+    segment_count = len(result.segments[0]) if segments_path is not None else 0
+    if progress is not None:
+        progress.total = n + segment_count
+
+    with open(metrics_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "arrival", "burst", "priority", "end", "turnaround", "waiting"])
+        for start in range(0, n, CHUNK_SIZE):
+            writer.writerows(metric_rows(result, start, min(start + CHUNK_SIZE, n)))
+            if progress is not None:
+                progress.update(min(start + CHUNK_SIZE, n))
+
+    if segments_path is not None:
+        with open(segments_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "start", "end", "cpu"] if isinstance(result, SMPResult) else ["name", "start", "end"])
+            for start in range(0, segment_count, CHUNK_SIZE):
+                writer.writerows(segment_rows(result, start, min(start + CHUNK_SIZE, segment_count)))
+                if progress is not None:
+                    progress.update(n + min(start + CHUNK_SIZE, segment_count))
+
+
+def binary_segments_path(path):
+    """Segments file that goes with the archive at path: results.npz -> results_gantt.npy."""
+    return os.path.splitext(path)[0] + "_gantt.npy"
+
+
+def export_binary(result, path):
+    """Save the workload and end times as an uncompressed .npz and the Gantt segments beside it."""
+    workload = result.workload
+    save_segments(binary_segments_path(path), result.segments)
+    columns = {
+        "arrival": narrowest(workload.arrival), "burst": narrowest(workload.burst),
+        "end_times": narrowest(result.end_times),
+    }
+    if workload.priority is not None:
+        columns["priority"] = narrowest(workload.priority)
+    if workload.has_names:
+        columns["names"] = np.array(workload.names)
+    if isinstance(result, SMPResult):
+        columns["cores"] = narrowest(result.cores)
+        columns["cpus"] = result.cpus
+    np.savez(path, title=result.title, **columns)
+
+
+def load_binary(path):
+    """Read files written by export_binary back into a ScheduleResult or SMPResult."""
+    with np.load(path) as data:
+        workload = Workload(data["arrival"], data["burst"], data["priority"] if "priority" in data else None,
+                            data["names"].tolist() if "names" in data else None)
+        segments = load_segments(binary_segments_path(path))
+        if "cores" in data:
+            return SMPResult(str(data["title"]), workload, data["end_times"], segments,
+                             data["cores"].astype(np.int64), int(data["cpus"]))
+        return ScheduleResult(str(data["title"]), workload, data["end_times"], segments)
@@ -0,0 +1,781 @@
+"""Headless CPU scheduling core.
+
+Every algorithm takes a workload.Workload (plus a quantum for Round Robin
+and MLFQ) and returns a ScheduleResult. Nothing here imports tkinter or
+matplotlib, so the module can be used from batch jobs and workers on
+machines without a display; the only third-party dependency is NumPy.
+
+The policies themselves are OnlineScheduler subclasses registered in
+POLICIES with register_policy(). A policy only supplies its ready queue
+order and its slice and preemption rules; the simulation loop is shared,
+and the same objects can also be fed a live stream of jobs. run() loads a
+whole workload into one and runs it to completion; FCFS keeps a vectorized
+offline path.
+"""
+import heapq
+from array import array
+from bisect import bisect_right
+from collections import deque
+from time import perf_counter
+
+import numpy as np
+
+from instrumentation import ready_queue_stats
+from segments import SegmentStore
+from workload import fcfs_end_times
+
+
+class ScheduleResult:
+    """Outcome of one scheduling run.
+
+    end_times, turnaround_times and waiting_times are NumPy arrays indexed
+    by process id. segments is the Gantt chart in time order as three
+    arrays (process ids, starts, ends); algorithms may pass a
+    segments.SegmentStore instead. gantt_chart is the same chart as
+    (name, start, end) tuples, built on first use.
+
+    timings holds wall times in seconds of the phases of the run:
+    "metrics" for the per-process times computed here, "simulation" when
+    the run went through schedule(), and "rendering" once the GUI has
+    shown it.
+    """
+
+    cpus = 1
+
+    def __init__(self, title, workload, end_times, segments):
+        start = perf_counter()
+        self.title = title
+        self.workload = workload
+        self.end_times = np.asarray(end_times, dtype=np.int64)
+        if isinstance(segments, SegmentStore):
+            segments = segments.arrays()
+        self.segments = segments
+        self._gantt_chart = None
+
+        self.turnaround_times = self.end_times - workload.arrival
+        self.waiting_times = self.turnaround_times - workload.burst
+        self.avg_turnaround_time = float(self.turnaround_times.mean())
+        self.avg_waiting_time = float(self.waiting_times.mean())
+        self.timings = {"metrics": perf_counter() - start}
+
+    @property
+    def processes(self):
+        """(name, arrival, burst) rows in process id order."""
+        workload = self.workload
+        return list(zip(workload.names, workload.arrival.tolist(), workload.burst.tolist()))
+
+    @property
+    def gantt_chart(self):
+        if self._gantt_chart is None:
+            ids, starts, ends = self.segments
+            names = self.workload.names
+            self._gantt_chart = [(names[i], start, end) for i, start, end in zip(ids.tolist(), starts.tolist(), ends.tolist())]
+        return self._gantt_chart
+
+    def percentiles(self, q=(50, 95, 99)):
+        """Turnaround and waiting time percentiles as two rows, in one selection pass."""
+        return np.percentile([self.turnaround_times, self.waiting_times], q, axis=1).T
+
+    @property
+    def context_switches(self):
+        """Number of times the CPU moves from one process to a different one."""
+        ids = self.segments[0]
+        return int(np.count_nonzero(ids[1:] != ids[:-1]))
+
+    @property
+    def makespan(self):
+        """Time from the first arrival to the last completion."""
+        return int(self.end_times.max() - self.workload.arrival.min())
+
+    @property
+    def cpu_utilization(self):
+        """Fraction of the CPU time within the makespan spent running processes."""
+        makespan = self.makespan
+        return float(self.workload.burst.sum() / (self.cpus * makespan)) if makespan > 0 else 1.0
+
+    def lanes(self):
+        """(Gantt lane of every segment, number of lanes): one lane per process."""
+        return self.segments[0], len(self.workload)
+
+    def lane_label(self, lane):
+        return self.workload.name(lane)
+
+    def summary(self):
+        """Headline statistics of the run as a plain dict."""
+        turnaround_p95, waiting_p95 = np.percentile([self.turnaround_times, self.waiting_times], 95, axis=1)
+        return {
+            "title": self.title,
+            "processes": len(self.workload),
+            "avg_turnaround_time": self.avg_turnaround_time,
+            "p95_turnaround_time": float(turnaround_p95),
+            "max_turnaround_time": int(self.turnaround_times.max()),
+            "avg_waiting_time": self.avg_waiting_time,
+            "p95_waiting_time": float(waiting_p95),
+            "max_waiting_time": int(self.waiting_times.max()),
+            "context_switches": self.context_switches,
+            "cpu_utilization": self.cpu_utilization,
+            "makespan": self.makespan,
+        }
+
+    def stats(self):
+        """Counters describing how the run went, as a plain dict.
+
+        decisions counts dispatches that start a new Gantt segment: a
+        process picked again straight away continues its segment and is
+        not counted again.
+        """
+        max_ready, mean_ready = ready_queue_stats(self)
+        return {
+            "decisions": len(self.segments[0]),
+            "context_switches": self.context_switches,
+            "max_ready_queue": max_ready,
+            "mean_ready_queue": mean_ready,
+            "idle_time": self.cpus * self.makespan - int(self.workload.burst.sum()),
+            "cpu_utilization": self.cpu_utilization,
+            **{f"{phase}_time_s": seconds for phase, seconds in self.timings.items()},
+        }
+
+
+class Cancelled(Exception):
+    """Raised inside an algorithm when its run has been cancelled."""
+
+
+class RunProgress:
+    """Progress and cancellation flag shared between a run and its watcher.
+
+    Algorithms call update(completed) every PROGRESS_INTERVAL steps of
+    their simulation loop, so even a run that completes few processes is
+    reported on and can be cancelled. Once cancel() has been called, the
+    next update raises Cancelled.
+    """
+
+    def __init__(self, total=0):
+        self.total = total
+        self.completed = 0
+        self.cancelled = False
+
+    def update(self, completed):
+        self.completed = completed
+        if self.cancelled:
+            raise Cancelled()
+
+    def cancel(self):
+        self.cancelled = True
+
+
+PROGRESS_INTERVAL = 4096
+
+
+def check_workload(workload, needs_priority=False):
+    if len(workload) == 0:
+        raise ValueError("There are no processes to schedule.")
+    if needs_priority and workload.priority is None:
+        raise ValueError("This algorithm needs a priority for every process.")
+
+
+def fcfs(workload, progress=None):
+    check_workload(workload)
+    order, starts, ends = fcfs_end_times(workload)
+    end_times = np.empty_like(ends)
+    end_times[order] = ends
+    if progress is not None:
+        progress.update(len(workload))  # Vectorized, so progress is all or nothing
+    return ScheduleResult("FCFS Scheduling", workload, end_times, (order, starts, ends))
+
+
+def new_end_times(n):
+    # One machine word per process; ScheduleResult wraps it without copying
+    return array("q", bytes(8 * n))
+
+
+# Scheduling policies by the name shown in the GUI, in menu order
+POLICIES = {}
+
+
+def register_policy(name, short_name):
+    """Class decorator adding an OnlineScheduler subclass to POLICIES.
+
+    name is shown in the GUI and used by schedule(); short_name is the
+    command-line name, e.g. in benchmark.py.
+    """
+    def register(cls):
+        if name in POLICIES or any(policy.short_name == short_name for policy in POLICIES.values()):
+            raise ValueError(f"A policy called {name} ({short_name}) is already registered.")
+        cls.name, cls.short_name = name, short_name
+        POLICIES[name] = cls
+        return cls
+    return register
+
+
+class OnlineScheduler:
+    """Incremental scheduler that is fed jobs as they arrive.
+
+    Jobs are submitted in arrival order with submit(), which returns the
+    job's id. advance_to(t) simulates up to time t; by calling it the
+    caller promises that every job arriving before t has been submitted.
+    Gantt segments and finished jobs are collected as the simulation
+    produces them and handed out by take_segments() and take_completions().
+    next_decision() tells which job is dispatched next without running it.
+
+    Every policy runs on the same event-driven engine, advance(): the clock
+    jumps from one arrival, completion or end of a slice to the next, and
+    every step costs O(log n) in the number of waiting jobs, so a live feed
+    never re-simulates its history. The offline algorithms load a whole
+    workload with from_workload() and call finish().
+
+    A policy is a subclass that fills in the rules the engine asks for:
+
+    * make_key() returns key(i), the ready queue order of job i as a tuple
+      ending with i; the smallest key runs next. Without a key the ready
+      queue is first in, first out.
+    * make_time_slice() returns time_slice(i, time), the longest job i may
+      run when dispatched at time before the policy chooses again, or None
+      to let jobs run until they finish.
+    * preemptive policies also choose again at every arrival.
+    * review(time, ready) is called once the clock reaches next_review, for
+      policies that reorder waiting jobs at set times.
+
+    A job whose slice ends unfinished is put back in the ready queue after
+    the jobs that arrived during the slice. Keys may depend on
+    remaining_times, which is up to date whenever a job is put in the ready
+    queue, but must not change while the job waits. Decorating a subclass
+    with register_policy() makes it available to schedule(), the GUI, the
+    comparison and the benchmark.
+    """
+
+    name = None
+    short_name = None
+    title = None
+    needs_priority = False
+    needs_quantum = False
+    preemptive = False
+    next_review = float("inf")
+
+    def __init__(self, progress=None):
+        self.arrival_times = []
+        self.burst_times = []
+        self.priorities = []
+        self.remaining_times = []
+        self.end_times = array("q")
+        self.order = []  # Job ids in arrival order
+        self.next_arrival = 0  # Cursor into order: first job not yet ready
+        self.time = 0
+        self.horizon = 0  # Every job arriving before this has been submitted
+        self.last = None  # Job whose slice just ended, still to be put back
+        self.resume = False  # last was only stopped by the end of advance(), not by the policy
+        self.segments = SegmentStore()
+        self.finished = []  # Ids completed since the last take_completions()
+        self.completed = 0
+        self.progress = progress
+        self.key = self.make_key()
+        self.time_slice = self.make_time_slice()
+        self.ready = deque() if self.key is None else []  # Job ids, or a heap of keys
+
+    @classmethod
+    def from_workload(cls, workload, progress=None, **options):
+        """Scheduler with every process of workload already submitted."""
+        scheduler = cls(progress=progress, **options)
+        scheduler.arrival_times, scheduler.burst_times, priorities = workload.to_lists()
+        scheduler.priorities = priorities if priorities is not None else [None] * len(workload)
+        scheduler.remaining_times = list(scheduler.burst_times)
+        scheduler.end_times = new_end_times(len(workload))
+        scheduler.order = workload.arrival_order().tolist()
+        scheduler.key = scheduler.make_key()
+        scheduler.time_slice = scheduler.make_time_slice()
+        return scheduler
+
+    @classmethod
+    def run(cls, workload, progress=None, **options):
+        """Schedule a whole workload and return its ScheduleResult."""
+        check_workload(workload, cls.needs_priority)
+        scheduler = cls.from_workload(workload, progress, **options)
+        scheduler.finish()
+        return ScheduleResult(scheduler.title, workload, scheduler.end_times, scheduler.segments)
+
+    def make_key(self):
+        return None
+
+    def make_time_slice(self):
+        return None
+
+    def review(self, time, ready):
+        """Reorder the waiting jobs in ready once the clock reaches next_review.
+
+        Does nothing by default, and the engine skips the call for
+        policies that do not override it. An override also moves
+        next_review on to the next time it wants to be called.
+        """
+
+    def submit(self, arrival, burst, priority=None):
+        """Add a job and return its id."""
+        if arrival < self.horizon or (self.order and arrival < self.arrival_times[self.order[-1]]):
+            raise ValueError("Jobs must be submitted in arrival order.")
+        if burst < 0:
+            raise ValueError("Burst times cannot be negative.")
+        if self.needs_priority and priority is None:
+            raise ValueError("This algorithm needs a priority for every process.")
+        i = len(self.arrival_times)
+        self.arrival_times.append(arrival)
+        self.burst_times.append(burst)
+        self.priorities.append(priority)
+        self.remaining_times.append(burst)
+        self.end_times.append(0)
+        self.order.append(i)
+        return i
+
+    def advance_to(self, t):
+        """Simulate up to time t, once every job arriving before t is submitted."""
+        self.horizon = max(self.horizon, t)
+        self.advance(t)
+        self.time = max(self.time, t)  # Idle until t if nothing was left to run
+
+    def finish(self):
+        """Run every submitted job to completion; nothing can be submitted after."""
+        self.horizon = float("inf")
+        self.advance(self.horizon)
+
+    def advance(self, until):
+        arrival_times, remaining_times, end_times = self.arrival_times, self.remaining_times, self.end_times
+        order, ready, add_segment, finished = self.order, self.ready, self.segments.append, self.finished
+        key, time_slice, preemptive, progress = self.key, self.time_slice, self.preemptive, self.progress
+        fifo = key is None
+        heappush, heappop = heapq.heappush, heapq.heappop
+        n = len(order)
+        time, next_arrival, completed, last = self.time, self.next_arrival, self.completed, self.last
+        resume = self.resume
+        steps = 0
+        reviews = type(self).review is not OnlineScheduler.review
+        next_review = self.next_review
+
+        while time < until:
+            steps += 1
+            if progress is not None and steps % PROGRESS_INTERVAL == 0:
+                progress.update(completed)
+
+            # Move every job that has arrived by now into the ready queue
+            arrived = next_arrival
+            if fifo:
+                while next_arrival < n and arrival_times[order[next_arrival]] <= time:
+                    ready.append(order[next_arrival])
+                    next_arrival += 1
+            else:
+                while next_arrival < n and arrival_times[order[next_arrival]] <= time:
+                    heappush(ready, key(order[next_arrival]))
+                    next_arrival += 1
+
+            if last is not None and resume and next_arrival == arrived and not (reviews and time >= next_review):
+                # Only the previous until stopped it, so nothing is decided here
+                i = last
+                last = None
+            else:
+                # Put back the job whose slice just ended, behind the arrivals
+                if last is not None:
+                    if fifo:
+                        ready.append(last)
+                    else:
+                        heappush(ready, key(last))
+                    last = None
+                if reviews and time >= next_review:
+                    self.review(time, ready)
+                    next_review = self.next_review
+
+                if not ready:
+                    if next_arrival < n and arrival_times[order[next_arrival]] < until:
+                        time = arrival_times[order[next_arrival]]  # Idle until the next arrival
+                        continue
+                    break
+
+                i = ready.popleft() if fifo else heappop(ready)[-1]
+
+            # Run until the job finishes or its slice ends; a preemptive
+            # policy also stops at the next arrival, the next review and until
+            run_until = time + remaining_times[i]
+            if time_slice is not None:
+                slice_end = time + time_slice(i, time)
+                if slice_end < run_until:
+                    run_until = slice_end
+            if preemptive:
+                if next_arrival < n and arrival_times[order[next_arrival]] < run_until:
+                    run_until = arrival_times[order[next_arrival]]
+                if reviews and run_until > next_review:
+                    run_until = next_review
+                resume = run_until > until
+                if resume:
+                    run_until = until
+
+            # Non-preemptive runs of zero bursts keep their empty segment
+            if run_until > time or not preemptive:
+                add_segment(i, time, run_until)
+            remaining_times[i] -= run_until - time
+            time = run_until
+
+            if remaining_times[i] == 0:
+                end_times[i] = time
+                finished.append(i)
+                completed += 1
+            else:
+                last = i
+
+        self.time, self.next_arrival, self.completed, self.last, self.resume = time, next_arrival, completed, last, resume
+
+    def next_decision(self):
+        """(id, start time) of the next dispatch given the jobs submitted so far, or None."""
+        if self.key is None:
+            # Look only: the queue order depends on jobs that may still arrive now
+            if self.ready:
+                return self.ready[0], self.time
+            i = self.pending()
+            if i is not None and self.arrival_times[i] <= self.time:
+                return i, self.time
+            if self.last is not None:
+                return self.last, self.time
+            if i is not None:
+                return i, self.arrival_times[i]
+            return None
+
+        arrival_now = self.pending() is not None and self.arrival_times[self.pending()] <= self.time
+        if self.last is not None and self.resume and not arrival_now and self.time < self.next_review:
+            return self.last, self.time  # Carries on until an arrival or its slice ends
+        if not self.ready and self.last is None and self.pending() is not None:
+            self.time = max(self.time, self.arrival_times[self.pending()])  # Idle until the next arrival
+        while self.pending() is not None and self.arrival_times[self.pending()] <= self.time:
+            heapq.heappush(self.ready, self.key(self.pending()))
+            self.next_arrival += 1
+        if self.last is not None:
+            heapq.heappush(self.ready, self.key(self.last))
+            self.last = None
+        if self.time >= self.next_review:
+            self.review(self.time, self.ready)
+        return (self.ready[0][-1], self.time) if self.ready else None
+
+    def take_segments(self):
+        """SegmentStore of the Gantt segments produced since the last call.
+
+        A run that spans two calls may come back as two adjacent segments.
+        """
+        segments, self.segments = self.segments, SegmentStore()
+        return segments
+
+    def take_completions(self):
+        """(id, end, turnaround, waiting) of the jobs finished since the last call."""
+        finished, self.finished = self.finished, []
+        return [(i, self.end_times[i], self.end_times[i] - self.arrival_times[i],
+                 self.end_times[i] - self.arrival_times[i] - self.burst_times[i]) for i in finished]
+
+    def pending(self):
+        # Id of the next job still to arrive, or None
+        return self.order[self.next_arrival] if self.next_arrival < len(self.order) else None
+
+
+class NonPreemptiveScheduler(OnlineScheduler):
+    """Runs the ready job with the smallest key to completion.
+
+    A dispatched job cannot be interrupted, so its segment and completion
+    are reported as soon as it is dispatched.
+    """
+
+
+class PreemptiveScheduler(OnlineScheduler):
+    """Always runs the ready job with the smallest key.
+
+    Subclasses also provide make_running_key(), a key(i, finish) for a job
+    running until finish that does not change while it runs and orders
+    running jobs the opposite way to their current keys; the multi-CPU
+    engine keeps running jobs in a heap of these to find the one to preempt.
+    """
+
+    preemptive = True
+
+
+@register_policy("First Come First Serve, FCFS", "fcfs")
+class FCFSScheduler(NonPreemptiveScheduler):
+    title = "FCFS Scheduling"
+
+    @classmethod
+    def run(cls, workload, progress=None):
+        return fcfs(workload, progress)  # Same schedule, computed with NumPy
+
+    def make_key(self):
+        # Earliest arrival, then entry order
+        arrival_times = self.arrival_times
+        return lambda i: (arrival_times[i], i)
+
+
+@register_policy("Shortest Job First, SJF", "sjf")
+class SJFScheduler(NonPreemptiveScheduler):
+    title = "SJF Scheduling"
+
+    def make_key(self):
+        # Shortest burst first, then earliest arrival, then entry order
+        arrival_times, burst_times = self.arrival_times, self.burst_times
+        return lambda i: (burst_times[i], arrival_times[i], i)
+
+
+@register_policy("Shortest Remaining Time First, SRTF", "srtf")
+class SRTFScheduler(PreemptiveScheduler):
+    title = "SRTF Scheduling"
+
+    def make_key(self):
+        # Shortest remaining time first, ties go to the job entered first
+        remaining_times = self.remaining_times
+        return lambda i: (remaining_times[i], i)
+
+    def make_running_key(self):
+        # Running jobs all lose remaining time at the same rate, so they keep
+        # the order of their finish times
+        return lambda i, finish: (-finish, -i)
+
+
+@register_policy("Priority Scheduling (Preemptive)", "priority_preemptive")
+class PriorityPreemptiveScheduler(PreemptiveScheduler):
+    title = "Priority Preemptive Scheduling"
+    needs_priority = True
+
+    def make_key(self):
+        # Lowest priority value first, then earliest arrival, then entry order
+        arrival_times, priorities = self.arrival_times, self.priorities
+        return lambda i: (priorities[i], arrival_times[i], i)
+
+    def make_running_key(self):
+        arrival_times, priorities = self.arrival_times, self.priorities
+        return lambda i, finish: (-priorities[i], -arrival_times[i], -i)
+
+
+@register_policy("Priority Scheduling (Non-Preemptive)", "priority_non_preemptive")
+class PriorityNonPreemptiveScheduler(NonPreemptiveScheduler):
+    title = "Priority Non-Preemptive Scheduling"
+    needs_priority = True
+
+    def make_key(self):
+        # Lowest priority value first, then earliest arrival, then entry order
+        arrival_times, priorities = self.arrival_times, self.priorities
+        return lambda i: (priorities[i], arrival_times[i], i)
+
+
+@register_policy("Round Robin, RR", "round_robin")
+class RoundRobinScheduler(OnlineScheduler):
+    """Runs ready jobs in turn for at most quantum_time each.
+
+    A job whose slice ends goes to the back of the queue behind the jobs
+    that arrived during the slice, so it is only re-queued once the
+    arrivals up to the end of the slice are known.
+    """
+
+    title = "Round Robin Scheduling"
+    needs_quantum = True
+
+    def __init__(self, quantum_time, progress=None):
+        if quantum_time <= 0:
+            raise ValueError("Quantum time must be greater than zero.")
+        self.quantum_time = quantum_time
+        super().__init__(progress)
+
+    def make_time_slice(self):
+        quantum_time = self.quantum_time
+        return lambda i, time: quantum_time
+
+
+@register_policy("Multilevel Feedback Queue, MLFQ", "mlfq")
+class MLFQScheduler(PreemptiveScheduler):
+    """Multilevel feedback queue.
+
+    New jobs start in the top level. Level k runs its jobs first come,
+    first served for slices of quantum_time * 2**k and only when every
+    level above it is empty; a job that has used up a slice at level k
+    moves to the back of level k + 1, and the bottom level is Round Robin.
+    Arriving jobs preempt jobs of lower levels, and a preempted job keeps
+    its place and the rest of its slice. Every boost_interval time units
+    (by default twenty bottom level slices) all waiting jobs go back to the
+    top level, behind the jobs already there, so long jobs cannot starve
+    under a steady stream of short ones.
+
+    The level is worked out from the CPU time a job has had since the last
+    boost, and its place from when it got there, so the key of a waiting
+    job never changes and the ready queue is an ordinary heap. A job below
+    the top level is keyed by the time of the next boost, which already
+    puts it behind the top level jobs that join before the boost and ahead
+    of those that join after it. A boost therefore moves nothing; each job
+    notices it the next time it is dispatched and starts a new top level
+    slice, so a boost costs O(1) however many jobs are waiting.
+    """
+
+    title = "MLFQ Scheduling"
+    needs_quantum = True
+
+    def __init__(self, quantum_time, levels=3, boost_interval=None, progress=None):
+        if quantum_time <= 0:
+            raise ValueError("Quantum time must be greater than zero.")
+        if levels < 1:
+            raise ValueError("There must be at least one level.")
+        self.quantum_time = quantum_time
+        self.levels = levels
+        self.quanta = [quantum_time << level for level in range(levels)]
+        self.boost_interval = boost_interval if boost_interval is not None else 20 * self.quanta[-1]
+        if self.boost_interval <= 0:
+            raise ValueError("The boost interval must be greater than zero.")
+        self.next_review = self.boost_interval
+        self.boosts = 0  # Boosts so far
+        # CPU time since the last boost at which each level's slice runs out
+        self.stage_ends = [sum(self.quanta[:level + 1]) for level in range(levels)]
+        # Job id -> [CPU time since the last boost at which its slice runs out,
+        #            key, CPU time at the last boost, time its current slice ends,
+        #            boosts when it was last queued or dispatched]
+        self.stamps = {}
+        super().__init__(progress)
+
+    def stage(self, service):
+        """(level, end of the slice) of a job with service units of CPU time since the last boost."""
+        stage_ends, bottom_quantum = self.stage_ends, self.quanta[-1]
+        if service < stage_ends[-1]:
+            level = bisect_right(stage_ends, service)
+            return level, stage_ends[level]
+        # The bottom level is Round Robin: one more slice at a time
+        return self.levels - 1, service + bottom_quantum - (service - stage_ends[-1]) % bottom_quantum
+
+    def make_key(self):
+        # Top level: (time it joined, 0, 0 for arrivals or 1 after a full slice, id)
+        # Below: (time of the next boost, 1, level, time it joined, 1, id)
+        arrival_times, burst_times, remaining_times = self.arrival_times, self.burst_times, self.remaining_times
+        stamps, stage, first_end = self.stamps, self.stage, self.stage_ends[0]
+        scheduler = self
+
+        def key(i):
+            stamp = stamps.get(i)
+            if stamp is None:
+                stamp = stamps[i] = [first_end, (arrival_times[i], 0, 0, i), 0, 0, scheduler.boosts]
+            elif burst_times[i] - remaining_times[i] - stamp[2] >= stamp[0]:
+                # Used up its slice: to the back of the next level
+                level, stamp[0] = stage(burst_times[i] - remaining_times[i] - stamp[2])
+                stamp[1] = (stamp[3], 0, 1, i) if level == 0 else (scheduler.next_review, 1, level, stamp[3], 1, i)
+            return stamp[1]
+        return key
+
+    def make_time_slice(self):
+        burst_times, remaining_times, stamps = self.burst_times, self.remaining_times, self.stamps
+        first_end = self.stage_ends[0]
+        scheduler = self
+
+        def time_slice(i, time):
+            # The stamp was brought up to date when the job was queued
+            stamp = stamps[i]
+            service = burst_times[i] - remaining_times[i]
+            if stamp[4] != scheduler.boosts:
+                # Boosted while it waited: a new top level slice, keeping its key
+                stamp[0], stamp[2], stamp[4] = first_end, service, scheduler.boosts
+            length = stamp[0] - (service - stamp[2])
+            stamp[3] = time + length  # When it moves down if it is not preempted first
+            return length
+        return time_slice
+
+    def make_running_key(self):
+        stamps = self.stamps
+        return lambda i, finish: tuple(-x for x in stamps[i][1])
+
+    def review(self, time, ready):
+        """Priority boost: every waiting job is now in the top level.
+
+        The keys already order the boosted jobs behind the top level, so
+        ready is left as it is.
+        """
+        self.boosts += 1
+        self.next_review = (time // self.boost_interval + 1) * self.boost_interval
+
+
+AGING_INTERVAL = 100
+
+
+@register_policy("Priority Scheduling with Aging", "aging_priority")
+class AgingPriorityScheduler(PreemptiveScheduler):
+    """Preemptive priority scheduling where waiting raises a job's priority.
+
+    A job gains one priority level for every aging_interval time units it
+    has spent waiting since it arrived, so its effective priority is
+    priority - (now - arrival - CPU time received) / aging_interval. A job
+    of low priority therefore overtakes newly arriving jobs of any better
+    priority after a bounded wait and cannot starve the way it can under
+    plain preemptive priority scheduling.
+
+    Every waiting job ages at the same rate, so the order of effective
+    priorities is the order of priority * aging_interval + arrival + CPU
+    time received, a key that only changes while the job runs. As with the
+    other preemptive policies the choice is made again at every arrival
+    and completion.
+    """
+
+    title = "Priority Scheduling with Aging"
+    needs_priority = True
+
+    def __init__(self, aging_interval=AGING_INTERVAL, progress=None):
+        if aging_interval <= 0:
+            raise ValueError("The aging interval must be greater than zero.")
+        self.aging_interval = aging_interval
+        super().__init__(progress)
+
+    def make_key(self):
+        # Best effective priority first, then earliest arrival, then entry order
+        arrival_times, burst_times, remaining_times, priorities = (
+            self.arrival_times, self.burst_times, self.remaining_times, self.priorities)
+        aging_interval = self.aging_interval
+        return lambda i: (priorities[i] * aging_interval + arrival_times[i] + burst_times[i] - remaining_times[i],
+                          arrival_times[i], i)
+
+    def make_running_key(self):
+        # A running job's key grows with the time it runs, in step with the
+        # others, so the order is fixed by where each key will be at finish
+        arrival_times, burst_times, priorities = self.arrival_times, self.burst_times, self.priorities
+        aging_interval = self.aging_interval
+        return lambda i, finish: (finish - priorities[i] * aging_interval - arrival_times[i] - burst_times[i],
+                                  -arrival_times[i], -i)
+
+
+def sjf(workload, progress=None):
+    return SJFScheduler.run(workload, progress)
+
+
+def srtf(workload, progress=None):
+    return SRTFScheduler.run(workload, progress)
+
+
+def priority_preemptive(workload, progress=None):
+    return PriorityPreemptiveScheduler.run(workload, progress)
+
+
+def priority_non_preemptive(workload, progress=None):
+    return PriorityNonPreemptiveScheduler.run(workload, progress)
+
+
+def round_robin(workload, quantum_time, progress=None):
+    return RoundRobinScheduler.run(workload, progress, quantum_time=quantum_time)
+
+
+def mlfq(workload, quantum_time, progress=None, **options):
+    return MLFQScheduler.run(workload, progress, quantum_time=quantum_time, **options)
+
+
+def aging_priority(workload, progress=None, **options):
+    return AgingPriorityScheduler.run(workload, progress, **options)
+
+
+def policy_options(algorithm, quantum_time=None):
+    """Constructor options for the policy named algorithm: the quantum if it takes one."""
+    if algorithm not in POLICIES:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    return {"quantum_time": quantum_time} if POLICIES[algorithm].needs_quantum else {}
+
+
+def schedule(algorithm, workload, quantum_time=None, progress=None, profile=None):
+    """Run the policy named as in POLICIES and return its ScheduleResult.
+
+    progress, if given, is a RunProgress that is updated as processes
+    complete and can be used to cancel the run from another thread.
+    profile, if given, is an instrumentation.RunProfiler to run under.
+    """
+    options = policy_options(algorithm, quantum_time)
+    if progress is not None:
+        progress.total = len(workload)
+    run = POLICIES[algorithm].run
+
+    start = perf_counter()
+    result = run(workload, progress, **options) if profile is None else profile.run(run, workload, progress, **options)
+    result.timings["simulation"] = perf_counter() - start - result.timings["metrics"]
+    return result
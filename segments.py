@@ -0,0 +1,69 @@
+"""Run-length-encoded Gantt segment storage.
+
+A SegmentStore keeps a schedule's Gantt chart as three packed integer
+arrays (process ids, starts, ends) and merges a segment into the previous
+one when the same process simply keeps running, so it grows with the
+number of dispatches rather than with simulated time. save_segments()
+writes the three columns as one .npy file in the narrowest integer dtype
+that holds them, and load_segments() maps that file back into memory
+without parsing it. This is the on-disk format of segments everywhere:
+the result cache's disk tier and results.export_binary both use it.
+"""
+from array import array
+
+import numpy as np
+
+
+def narrowest_dtype(*columns):
+    """Smallest integer dtype that holds every value in columns."""
+    types = [np.min_scalar_type(bound) for column in columns if len(column) for bound in (column.min(), column.max())]
+    return np.result_type(*types) if types else np.dtype(np.int64)
+
+
+def narrowest(values):
+    """values in the smallest integer dtype that holds all of them."""
+    return values.astype(narrowest_dtype(values))
+
+
+class SegmentStore:
+    """Append-only Gantt chart of (process id, start, end) segments in time order."""
+
+    def __init__(self):
+        self.ids = array("q")
+        self.starts = array("q")
+        self.ends = array("q")
+
+    def append(self, i, start, end):
+        ends = self.ends
+        if ends and ends[-1] == start and self.ids[-1] == i:
+            ends[-1] = end  # Same process still running: extend its segment
+        else:
+            self.ids.append(i)
+            self.starts.append(start)
+            ends.append(end)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return zip(self.ids, self.starts, self.ends)
+
+    def arrays(self):
+        """(ids, starts, ends) as int64 NumPy arrays sharing the store's memory."""
+        return tuple(np.frombuffer(column, dtype=np.int64) for column in (self.ids, self.starts, self.ends))
+
+
+def save_segments(path, segments):
+    """Write (ids, starts, ends) arrays to path as one 3 x n .npy file."""
+    ids, starts, ends = segments
+    # Signed, so differences of the mapped columns cannot wrap around
+    dtype = np.result_type(narrowest_dtype(*segments), np.int8)
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(3, len(ids)))
+    out[0], out[1], out[2] = ids, starts, ends
+    out.flush()
+
+
+def load_segments(path):
+    """Map a file written by save_segments; returns (ids, starts, ends) views of it."""
+    columns = np.load(path, mmap_mode="r")
+    return columns[0], columns[1], columns[2]
@@ -0,0 +1,272 @@
+"""Multi-CPU (SMP) simulation of the scheduling policies.
+
+simulate_smp runs any policy from scheduling.POLICIES on a machine with
+several identical CPUs. With a shared run queue every CPU takes the best
+waiting job from one global queue, and a preemptive policy preempts the
+worst running job anywhere. With per-core queues each arriving job goes to
+an idle CPU if there is one, or else to the next CPU in turn. A CPU that
+runs out of work steals the best job of the CPU with the longest queue.
+
+The simulation is event driven like the single-CPU engines. The next
+event is the earliest arrival or the earliest end of a running slice, and
+every step is a heap or deque operation, so its cost does not grow with
+the number of CPUs. Each CPU keeps its own SegmentStore, which becomes
+one Gantt lane per CPU.
+"""
+import heapq
+from collections import deque
+from time import perf_counter
+
+import numpy as np
+
+from scheduling import PROGRESS_INTERVAL, POLICIES, ScheduleResult, check_workload, new_end_times, policy_options
+from segments import SegmentStore
+
+
+class SMPResult(ScheduleResult):
+    """ScheduleResult of a run on several CPUs.
+
+    segments come lane by lane, each lane in time order, and cores gives
+    the CPU every segment ran on.
+    """
+
+    def __init__(self, title, workload, end_times, segments, cores, cpus):
+        super().__init__(title, workload, end_times, segments)
+        self.cores = cores
+        self.cpus = cpus
+
+    @property
+    def context_switches(self):
+        """Number of times a CPU moves from one process to a different one."""
+        ids, cores = self.segments[0], self.cores
+        return int(np.count_nonzero((ids[1:] != ids[:-1]) & (cores[1:] == cores[:-1])))
+
+    @property
+    def throughput(self):
+        """Processes completed per time unit over the makespan."""
+        makespan = self.makespan
+        return len(self.workload) / makespan if makespan > 0 else float("inf")
+
+    def core_utilization(self):
+        """Fraction of the makespan each CPU spends running processes."""
+        _, starts, ends = self.segments
+        busy = np.bincount(self.cores, weights=ends - starts, minlength=self.cpus)
+        makespan = self.makespan
+        return busy / makespan if makespan > 0 else np.ones(self.cpus)
+
+    def lanes(self):
+        return self.cores, self.cpus
+
+    def lane_label(self, lane):
+        return f"CPU {lane}"
+
+    def summary(self):
+        summary = super().summary()
+        summary["cpus"] = self.cpus
+        summary["throughput"] = self.throughput
+        return summary
+
+    def stats(self):
+        stats = super().stats()
+        utilization = self.core_utilization()
+        stats["min_core_utilization"] = float(utilization.min())
+        stats["max_core_utilization"] = float(utilization.max())
+        return stats
+
+
+def simulate_smp(algorithm, workload, cpus, quantum_time=None, shared_queue=True, progress=None):
+    """Run the policy named as in scheduling.POLICIES on cpus CPUs.
+
+    shared_queue selects one global run queue; otherwise every CPU has its
+    own queue and idle CPUs steal work. Returns an SMPResult.
+    """
+    options = policy_options(algorithm, quantum_time)
+    if cpus < 1:
+        raise ValueError("There must be at least one CPU.")
+    scheduler_class = POLICIES[algorithm]
+    check_workload(workload, scheduler_class.needs_priority)
+    # The policy object supplies the job tables and its scheduling rules
+    policy = scheduler_class.from_workload(workload, **options)
+    if progress is not None:
+        progress.total = len(workload)
+
+    start = perf_counter()
+    lanes, end_times = run_smp(policy, cpus, shared_queue, progress)
+    ids, starts, ends, cores = [], [], [], []
+    for c, lane in enumerate(lanes):
+        lane_ids, lane_starts, lane_ends = lane.arrays()
+        ids.append(lane_ids)
+        starts.append(lane_starts)
+        ends.append(lane_ends)
+        cores.append(np.full(len(lane), c, dtype=np.int64))
+    segments = (np.concatenate(ids), np.concatenate(starts), np.concatenate(ends))
+
+    queues = "shared queue" if shared_queue else "per-core queues"
+    result = SMPResult(f"{policy.title} ({cpus} CPUs, {queues})", workload, end_times, segments,
+                       np.concatenate(cores), cpus)
+    result.timings["simulation"] = perf_counter() - start - result.timings["metrics"]
+    return result
+
+
+def run_smp(policy, cpus, shared_queue, progress=None):
+    arrival_times, remaining_times, order, key = policy.arrival_times, policy.remaining_times, policy.order, policy.key
+    time_slice, preemptive = policy.time_slice, policy.preemptive
+    n = len(order)
+    fifo = key is None
+    running_key = policy.make_running_key() if preemptive else None
+    next_review = policy.next_review
+    end_times = new_end_times(n)
+
+    # Queue g serves CPU g, or every CPU when the queue is shared
+    queue_count = 1 if shared_queue else cpus
+    queues = [deque() if fifo else [] for _ in range(queue_count)]
+    loaded = set()  # Per-core queues that have jobs waiting, for stealing
+    running = [-1] * cpus  # Job on each CPU, -1 when idle
+    run_start = [0] * cpus
+    run_end = [0] * cpus
+    token = [0] * cpus  # Bumped on every dispatch; older events are stale
+    events = []  # Heap of (end of slice, cpu, token)
+    worst = [[] for _ in range(queue_count)]  # Preemptive only: heaps of (running key, cpu, token)
+    idle = list(range(cpus))  # Heap of idle CPUs
+    lanes = [SegmentStore() for _ in range(cpus)]
+
+    def push(g, i):
+        if fifo:
+            queues[g].append(i)
+        else:
+            heapq.heappush(queues[g], key(i))
+        if not shared_queue:
+            loaded.add(g)
+
+    def pop(g):
+        queue = queues[g]
+        i = queue.popleft() if fifo else heapq.heappop(queue)[-1]
+        if not queue:
+            loaded.discard(g)
+        return i
+
+    def dispatch(c, i):
+        running[c] = i
+        run_start[c] = time
+        run_end[c] = time + remaining_times[i]
+        if time_slice is not None:
+            run_end[c] = min(run_end[c], time + time_slice(i, time))
+        token[c] += 1
+        heapq.heappush(events, (run_end[c], c, token[c]))
+        if running_key is not None:
+            g = 0 if shared_queue else c
+            heapq.heappush(worst[g], (running_key(i, run_end[c]), c, token[c]))
+
+    def stop(c):
+        # Close the segment of CPU c at time; returns its job
+        i = running[c]
+        if time > run_start[c] or not preemptive:  # Like the one-CPU engine, keep empty runs of zero bursts
+            lanes[c].append(i, run_start[c], time)
+        remaining_times[i] -= time - run_start[c]
+        running[c] = -1
+        token[c] += 1
+        return i
+
+    def preempt(g):
+        # Swap the worst running job of queue g for better waiting ones
+        heap, queue = worst[g], queues[g]
+        while queue:
+            while heap and heap[0][2] != token[heap[0][1]]:
+                heapq.heappop(heap)
+            if not heap:
+                return
+            c = heap[0][1]
+            i = running[c]
+            elapsed = time - run_start[c]
+            remaining_times[i] -= elapsed  # Current key of the running job
+            better = queue[0] < key(i)
+            remaining_times[i] += elapsed
+            if not better:
+                return
+            heapq.heappop(heap)
+            push(g, stop(c))
+            dispatch(c, pop(g))
+
+    time = 0
+    next_arrival = 0
+    next_core = 0  # Round-robin placement for per-core queues
+    completed = 0
+    steps = 0
+    while completed < n:
+        steps += 1
+        if progress is not None and steps % PROGRESS_INTERVAL == 0:
+            progress.update(completed)
+        while events and events[0][2] != token[events[0][1]]:
+            heapq.heappop(events)
+        time = events[0][0] if events else arrival_times[order[next_arrival]]
+        if next_arrival < n and arrival_times[order[next_arrival]] < time:
+            time = arrival_times[order[next_arrival]]
+        if events and next_review < time:
+            time = next_review  # With every CPU idle, jump to the arrival and review there
+
+        # Slices ending now; unfinished jobs go back behind the arrivals
+        requeue = []
+        freed = []
+        while events and events[0][0] == time:
+            _, c, event_token = heapq.heappop(events)
+            if event_token != token[c]:
+                continue
+            i = stop(c)
+            freed.append(c)
+            if remaining_times[i] == 0:
+                end_times[i] = time
+                completed += 1
+            else:
+                requeue.append((0 if shared_queue else c, i))
+            if shared_queue or not (queues[c] or remaining_times[i]):
+                heapq.heappush(idle, c)
+
+        arrived = []
+        while next_arrival < n and arrival_times[order[next_arrival]] <= time:
+            i = order[next_arrival]
+            next_arrival += 1
+            if shared_queue:
+                g = 0
+            elif idle:
+                g = heapq.heappop(idle)  # Claimed now so the next arrival goes elsewhere
+                freed.append(g)
+            else:
+                g = next_core
+                next_core = (next_core + 1) % cpus
+            push(g, i)
+            arrived.append(g)
+        for g, i in requeue:
+            push(g, i)
+
+        if time >= next_review:
+            # Preemptive policies stop every CPU so that the review sees all jobs
+            if preemptive:
+                for c in range(cpus):
+                    if running[c] >= 0:
+                        push(0 if shared_queue else c, stop(c))
+                        freed.append(c)
+                        if shared_queue:
+                            heapq.heappush(idle, c)
+            for queue in queues:
+                policy.review(time, queue)
+            next_review = policy.next_review
+
+        # Hand out work: shared queue to idle CPUs, per-core queues to their own CPU
+        if shared_queue:
+            while idle and queues[0]:
+                dispatch(heapq.heappop(idle), pop(0))
+            if running_key is not None and arrived and not idle:
+                preempt(0)
+        else:
+            for c in freed:
+                if running[c] < 0 and queues[c]:
+                    dispatch(c, pop(c))
+            if running_key is not None:
+                for g in arrived:
+                    if running[g] >= 0:
+                        preempt(g)
+            # Idle CPUs steal from the longest queue
+            while idle and loaded:
+                dispatch(heapq.heappop(idle), pop(max(loaded, key=lambda g: len(queues[g]))))
+
+    return lanes, end_times
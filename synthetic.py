@@ -0,0 +1,109 @@
+"""Seeded synthetic workload generators.
+
+generate_workload builds a Workload from an arrival process, a burst size
+distribution and a priority distribution, all drawn from one NumPy
+Generator so the same seed always gives the same workload.
+"""
+import numpy as np
+
+from workload import Workload
+
+ARRIVAL_PROCESSES = ("poisson", "storm", "batch")
+BURST_DISTRIBUTIONS = ("pareto", "exponential", "uniform")
+PRIORITY_DISTRIBUTIONS = ("uniform", "zipf", "bimodal")
+
+
+def poisson_arrivals(rng, n, rate):
+    """Arrival times of a Poisson process with the given rate per time unit."""
+    return np.floor(np.cumsum(rng.exponential(1 / rate, n))).astype(np.int64)
+
+
+def storm_arrivals(rng, n, rate, storm_fraction=0.3, storm_size=200):
+    """Poisson background traffic with storms of near-simultaneous arrivals.
+
+    About storm_fraction of the processes arrive in storms of storm_size
+    jobs each, all within a few time units of the storm's start.
+    """
+    n_storm = int(n * storm_fraction)
+    background = poisson_arrivals(rng, n - n_storm, rate * (1 - storm_fraction))
+    horizon = max(int(background[-1]) if len(background) else 0, 1)
+
+    n_storms = max(1, n_storm // storm_size)
+    storm_starts = rng.integers(0, horizon, n_storms)
+    storm = storm_starts[rng.integers(0, n_storms, n_storm)] + rng.integers(0, 5, n_storm)
+    return np.sort(np.concatenate([background, storm]))
+
+
+def batch_arrivals(rng, n):
+    """Everything arrives at time 0."""
+    return np.zeros(n, dtype=np.int64)
+
+
+def pareto_bursts(rng, n, mean=10, shape=1.5, cap=None):
+    """Heavy-tailed burst times: mostly short jobs with a few huge ones."""
+    scale = mean * (shape - 1) / shape  # Pareto mean is scale * shape / (shape - 1)
+    bursts = np.ceil(scale * (1 + rng.pareto(shape, n))).astype(np.int64)
+    if cap is not None:
+        np.minimum(bursts, cap, out=bursts)
+    return bursts
+
+
+def exponential_bursts(rng, n, mean=10):
+    return np.maximum(1, np.ceil(rng.exponential(mean, n))).astype(np.int64)
+
+
+def uniform_bursts(rng, n, mean=10):
+    return rng.integers(1, 2 * mean, n, dtype=np.int64)
+
+
+def priorities(rng, n, distribution="uniform", levels=8):
+    """Priority values in [0, levels), lower meaning more important."""
+    if distribution == "uniform":
+        return rng.integers(0, levels, n, dtype=np.int64)
+    if distribution == "zipf":
+        # Few urgent jobs, many background ones
+        return (levels - np.minimum(rng.zipf(2.0, n), levels)).astype(np.int64)
+    if distribution == "bimodal":
+        urgent = rng.random(n) < 0.2
+        return np.where(urgent, rng.integers(0, 2, n), rng.integers(levels - 2, levels, n)).astype(np.int64)
+    raise ValueError(f"Unknown priority distribution: {distribution}")
+
+
+def generate_workload(n, seed=0, arrivals="poisson", bursts="pareto", load=0.9, mean_burst=10,
+                      priority_distribution="uniform", priority_levels=8):
+    """Build a seeded synthetic Workload of n processes.
+
+    load is the offered CPU utilisation: arrivals come at load / mean_burst
+    processes per time unit, so values above 1 build up an ever-growing
+    backlog.
+    """
+    rng = np.random.default_rng(seed)
+    rate = load / mean_burst
+
+    if arrivals == "poisson":
+        arrival = poisson_arrivals(rng, n, rate)
+    elif arrivals == "storm":
+        arrival = storm_arrivals(rng, n, rate)
+    elif arrivals == "batch":
+        arrival = batch_arrivals(rng, n)
+    else:
+        raise ValueError(f"Unknown arrival process: {arrivals}")
+
+    if bursts == "pareto":
+        burst = pareto_bursts(rng, n, mean_burst)
+    elif bursts == "exponential":
+        burst = exponential_bursts(rng, n, mean_burst)
+    elif bursts == "uniform":
+        burst = uniform_bursts(rng, n, mean_burst)
+    else:
+        raise ValueError(f"Unknown burst distribution: {bursts}")
+
+    priority = priorities(rng, n, priority_distribution, priority_levels)
+    return Workload(arrival, burst, priority)
+
+
+def quantum_for(workload, quantum):
+    """Resolve a quantum setting: an int, or "pNN" for that percentile of bursts."""
+    if isinstance(quantum, str) and quantum.startswith("p"):
+        return max(1, int(np.percentile(workload.burst, float(quantum[1:]))))
+    return int(quantum)
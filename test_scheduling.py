@@ -0,0 +1,153 @@
+"""Regression tests for the shared scheduling engine.
+
+The six original policies are pinned to the schedules the original GUI
+produced for a small workload with ties and an idle gap, and every
+registered policy is checked to give the same schedule when its jobs are
+fed in live with submit() and advance_to() as when run offline. Runs
+must also be cancellable long before any process completes.
+"""
+import random
+
+import pytest
+
+from scheduling import POLICIES, Cancelled, RunProgress, schedule
+from smp import simulate_smp
+from workload import Workload
+
+NAMES = ["P1", "P2", "P3", "P4", "P5", "P6"]
+ARRIVALS = [0, 2, 2, 4, 20, 21]
+BURSTS = [7, 4, 1, 4, 3, 2]
+PRIORITIES = [3, 1, 4, 1, 2, 1]
+QUANTUM = 2
+
+# (end times, merged Gantt chart) of the original implementations
+BASELINE = {
+    "First Come First Serve, FCFS": (
+        [7, 11, 12, 16, 23, 25],
+        [("P1", 0, 7), ("P2", 7, 11), ("P3", 11, 12), ("P4", 12, 16), ("P5", 20, 23), ("P6", 23, 25)]),
+    "Shortest Job First, SJF": (
+        [7, 12, 8, 16, 23, 25],
+        [("P1", 0, 7), ("P3", 7, 8), ("P2", 8, 12), ("P4", 12, 16), ("P5", 20, 23), ("P6", 23, 25)]),
+    "Shortest Remaining Time First, SRTF": (
+        [16, 7, 3, 11, 23, 25],
+        [("P1", 0, 2), ("P3", 2, 3), ("P2", 3, 7), ("P4", 7, 11), ("P1", 11, 16), ("P5", 20, 23),
+         ("P6", 23, 25)]),
+    "Priority Scheduling (Preemptive)": (
+        [15, 6, 16, 10, 25, 23],
+        [("P1", 0, 2), ("P2", 2, 6), ("P4", 6, 10), ("P1", 10, 15), ("P3", 15, 16), ("P5", 20, 21),
+         ("P6", 21, 23), ("P5", 23, 25)]),
+    "Priority Scheduling (Non-Preemptive)": (
+        [7, 11, 16, 15, 23, 25],
+        [("P1", 0, 7), ("P2", 7, 11), ("P4", 11, 15), ("P3", 15, 16), ("P5", 20, 23), ("P6", 23, 25)]),
+    "Round Robin, RR": (
+        [16, 11, 5, 15, 25, 24],
+        [("P1", 0, 2), ("P2", 2, 4), ("P3", 4, 5), ("P1", 5, 7), ("P4", 7, 9), ("P2", 9, 11), ("P1", 11, 13),
+         ("P4", 13, 15), ("P1", 15, 16), ("P5", 20, 22), ("P6", 22, 24), ("P5", 24, 25)]),
+}
+
+
+# Extra constructor options for the online check; short boosts so MLFQ boosts are exercised
+ONLINE_CASES = [(algorithm, {}) for algorithm in sorted(POLICIES)] + [
+    ("Multilevel Feedback Queue, MLFQ", {"boost_interval": 7}),
+    ("Multilevel Feedback Queue, MLFQ", {"levels": 1, "boost_interval": 5}),
+]
+
+
+def options(policy, **extra):
+    return {"quantum_time": QUANTUM, **extra} if policy.needs_quantum else extra
+
+
+def merged(segments):
+    # Drop empty runs and join a run split across two advance_to() calls
+    out = []
+    for i, start, end in segments:
+        if end == start:
+            continue
+        if out and out[-1][0] == i and out[-1][2] == start:
+            out[-1] = (i, out[-1][1], end)
+        else:
+            out.append((i, start, end))
+    return out
+
+
+@pytest.mark.parametrize("algorithm", sorted(BASELINE))
+def test_matches_original_schedule(algorithm):
+    policy = POLICIES[algorithm]
+    workload = Workload.from_lists(NAMES, ARRIVALS, BURSTS, PRIORITIES if policy.needs_priority else None)
+    result = policy.run(workload, **options(policy))
+    end_times, gantt_chart = BASELINE[algorithm]
+    assert result.end_times.tolist() == end_times
+    assert merged(result.gantt_chart) == gantt_chart
+
+
+def run_online(policy, workload, rng, **extra):
+    """(end times, merged segments) of workload fed to policy a few arrivals at a time."""
+    arrivals, bursts, priorities = workload.to_lists()
+    scheduler = policy(**options(policy, **extra))
+    order = workload.arrival_order().tolist()
+    ids, segments, completions = {}, [], []
+    k = 0
+    while k < len(order):
+        t = arrivals[order[k]] + rng.randint(0, 3)
+        while k < len(order) and arrivals[order[k]] < t:
+            ids[scheduler.submit(arrivals[order[k]], bursts[order[k]], priorities[order[k]])] = order[k]
+            k += 1
+        if rng.random() < 0.3:
+            scheduler.next_decision()
+        scheduler.advance_to(t)
+        segments += scheduler.take_segments()
+        completions += scheduler.take_completions()
+    scheduler.finish()
+    segments += scheduler.take_segments()
+    completions += scheduler.take_completions()
+
+    end_times = [0] * len(workload)
+    for i, end, _, _ in completions:
+        end_times[ids[i]] = end
+    return end_times, merged((ids[i], start, end) for i, start, end in segments)
+
+
+@pytest.mark.parametrize("algorithm, extra", ONLINE_CASES)
+def test_online_matches_offline(algorithm, extra):
+    policy = POLICIES[algorithm]
+    rng = random.Random(f"{algorithm} {extra}")
+    for _ in range(300):
+        n = rng.randint(1, 10)
+        arrivals = sorted(rng.randint(0, 25) for _ in range(n))
+        bursts = [rng.randint(0, 12) for _ in range(n)]
+        priorities = [rng.randint(0, 3) for _ in range(n)]
+        workload = Workload(arrivals, bursts, priorities)
+        result = policy.run(workload, **options(policy, **extra))
+        expected = (result.end_times.tolist(), merged(zip(*(column.tolist() for column in result.segments))))
+        assert run_online(policy, workload, rng, **extra) == expected, (arrivals, bursts, priorities)
+
+
+class CancelOnFirstUpdate(RunProgress):
+    def update(self, completed):
+        self.first_update = completed
+        self.cancel()
+        super().update(completed)
+
+
+@pytest.mark.parametrize("cpus", [1, 2])
+def test_cancel_long_round_robin(cpus):
+    # Two processes needing 10**9 slices each: only a loop that checks for
+    # cancellation as it goes can return
+    workload = Workload([0, 0], [10**9, 10**9])
+    progress = CancelOnFirstUpdate()
+    with pytest.raises(Cancelled):
+        if cpus == 1:
+            schedule("Round Robin, RR", workload, quantum_time=1, progress=progress)
+        else:
+            simulate_smp("Round Robin, RR", workload, cpus, quantum_time=1, progress=progress)
+    assert progress.first_update == 0
+
+
+def test_smp_skips_idle_gap():
+    # With no CPU busy the engine jumps straight to the next arrival instead
+    # of stopping at every MLFQ boost in between
+    workload = Workload([0, 10**8, 10**8], [1, 5, 3])
+    one = schedule("Multilevel Feedback Queue, MLFQ", workload, quantum_time=1)
+    two = simulate_smp("Multilevel Feedback Queue, MLFQ", workload, 2, quantum_time=1)
+    assert one.end_times.tolist() == [1, 10**8 + 8, 10**8 + 6]
+    assert two.end_times.tolist() == [1, 10**8 + 5, 10**8 + 3]
@@ -0,0 +1,59 @@
+"""Tests for loading CSV and JSONL traces with load_workload."""
+import json
+
+import pytest
+
+from workload import load_workload
+
+
+def write_jsonl(path, rows):
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    return path
+
+
+def test_csv_with_gui_headers(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text("Process Name,Arrival Time,Burst Time,Priority\nA,0,5,1\nB,2,3.0,2\n")
+    workload = load_workload(path)
+    assert workload.names == ["A", "B"]
+    assert workload.arrival.tolist() == [0, 2]
+    assert workload.burst.tolist() == [5, 3]
+    assert workload.priority.tolist() == [1, 2]
+
+
+def test_csv_short_row(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text("arrival,burst,priority\n0,5,1\n2,3\n")
+    with pytest.raises(ValueError, match="'priority'.*row 2"):
+        load_workload(path)
+
+
+def test_jsonl_without_optional_columns(tmp_path):
+    workload = load_workload(write_jsonl(tmp_path / "trace.jsonl", [{"arrival": 0, "burst": 1}, {"arrival": 2.0, "burst": "4"}]))
+    assert workload.arrival.tolist() == [0, 2]
+    assert workload.burst.tolist() == [1, 4]
+    assert workload.priority is None
+    assert not workload.has_names
+
+
+@pytest.mark.parametrize("rows, message", [
+    ([{"arrival": 1.7, "burst": 3}], "'arrival'.*row 1 has 1.7"),
+    ([{"arrival": 0, "burst": 1}, {"arrival": None, "burst": 3}], "'arrival'.*row 2 has None"),
+    ([{"arrival": 1e30, "burst": 3}], "out of range"),
+    ([{"burst": 3}], "no 'arrival' column"),
+    ([{"name": "a", "arrival": 0, "burst": 1}, {"arrival": 1, "burst": 2}], "'name'.*row 2"),
+    ([{"arrival": 0, "burst": 1}, {"arrival": 1, "burst": 2, "priority": 3}], "Row 2 has a 'priority' column"),
+    ([{"arrival": 0, "burst": 1, "priority": 3}, {"arrival": 1, "burst": 2}], "'priority'.*row 2"),
+])
+@pytest.mark.parametrize("chunk_size", [1, 65536])
+def test_jsonl_rejects_bad_rows(tmp_path, rows, message, chunk_size):
+    with pytest.raises(ValueError, match=message):
+        load_workload(write_jsonl(tmp_path / "trace.jsonl", rows), chunk_size)
+
+
+def test_chunks_are_joined(tmp_path):
+    rows = [{"name": f"P{i}", "arrival": i, "burst": i + 1, "priority": i % 3} for i in range(10)]
+    workload = load_workload(write_jsonl(tmp_path / "trace.jsonl", rows), chunk_size=3)
+    assert workload.names == [row["name"] for row in rows]
+    assert workload.burst.tolist() == list(range(1, 11))
+    assert workload.priority.tolist() == [i % 3 for i in range(10)]
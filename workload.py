@@ -0,0 +1,279 @@
+"""Columnar workload representation.
+
+A Workload keeps one NumPy array per field (arrival, burst, priority) with
+dense integer process ids, instead of a list of per-process tuples. Process
+names are optional; when they are not given they are generated on demand.
+
+Traces can be loaded from CSV or JSONL files with load_workload, which
+parses them in fixed-size chunks so memory stays bounded while reading.
+"""
+import csv
+import hashlib
+import json
+
+import numpy as np
+
+
+class Workload:
+    """Struct-of-arrays process table.
+
+    Process i has id i, arrival time arrival[i], burst time burst[i] and,
+    for priority scheduling, priority priority[i] (None when the workload
+    has no priorities). Names are display labels only: the algorithms work
+    on ids, so two processes may share a name.
+    """
+
+    def __init__(self, arrival, burst, priority=None, names=None):
+        self.arrival = np.ascontiguousarray(arrival, dtype=np.int64)
+        self.burst = np.ascontiguousarray(burst, dtype=np.int64)
+        self.priority = None if priority is None else np.ascontiguousarray(priority, dtype=np.int64)
+        self._names = None if names is None else list(names)
+
+        n = len(self.arrival)
+        if len(self.burst) != n:
+            raise ValueError("Arrival times and burst times must have the same length.")
+        if self.priority is not None and len(self.priority) != n:
+            raise ValueError("Priorities must have one value per process.")
+        if self._names is not None and len(self._names) != n:
+            raise ValueError("Process names must have one value per process.")
+        if n and self.burst.min() < 0:
+            raise ValueError("Burst times cannot be negative.")
+
+        self.ids = np.arange(n, dtype=np.int64)
+        self._arrival_order = None
+        self._fingerprint = None
+
+    @classmethod
+    def from_lists(cls, process_names, arrival_times, burst_times, priorities=None):
+        return cls(arrival_times, burst_times, priorities, process_names)
+
+    def __len__(self):
+        return len(self.arrival)
+
+    @property
+    def names(self):
+        if self._names is None:
+            self._names = [f"P{i + 1}" for i in range(len(self))]
+        return self._names
+
+    @property
+    def has_names(self):
+        """False when names are the generated P1, P2, ... defaults."""
+        return self._names is not None
+
+    def name(self, i):
+        return self._names[i] if self._names is not None else f"P{i + 1}"
+
+    def to_lists(self):
+        """Return (arrivals, bursts, priorities) as plain Python lists."""
+        priorities = None if self.priority is None else self.priority.tolist()
+        return self.arrival.tolist(), self.burst.tolist(), priorities
+
+    def changed(self):
+        """Drop cached derived data; call after editing the arrays in place."""
+        self._arrival_order = None
+        self._fingerprint = None
+
+    def fingerprint(self):
+        """Hex digest of everything that can change a schedule of this workload."""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=20)
+            digest.update(len(self).to_bytes(8, "little"))
+            digest.update(self.arrival.tobytes())
+            digest.update(self.burst.tobytes())
+            if self.priority is not None:
+                digest.update(b"priority")
+                digest.update(self.priority.tobytes())
+            if self._names is not None:
+                digest.update(b"names")
+                digest.update("\0".join(self._names).encode())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def arrival_order(self):
+        """Process ids sorted by arrival time, ties kept in id order.
+
+        The order is computed once and cached, so repeated runs over the same
+        workload (and worker processes it is pickled to) reuse it.
+        """
+        if self._arrival_order is None:
+            self._arrival_order = self.sort_by_arrival()
+        return self._arrival_order
+
+    def sort_by_arrival(self):
+        arrival = self.arrival
+        if len(arrival) < 2 or np.all(arrival[1:] >= arrival[:-1]):
+            return self.ids  # Traces are usually already in arrival order
+        n = len(arrival)
+        low = int(arrival.min())
+        if int(arrival.max()) - low < (2**63 - 1) // n:
+            # Fold the id into the key so the faster unstable sort keeps ties in id order
+            return np.argsort((arrival - low) * n + self.ids)
+        return np.argsort(arrival, kind="stable")
+
+
+def fcfs_end_times(workload):
+    """Vectorized FCFS: return (order, start times, end times) in run order.
+
+    Process k in arrival order finishes at cumsum(burst)[k] plus the largest
+    idle slack seen so far, i.e. a running maximum of arrival minus the work
+    queued before it.
+    """
+    order = workload.arrival_order()
+    arrival = workload.arrival[order]
+    burst = workload.burst[order]
+
+    work = np.cumsum(burst)
+    slack = np.maximum.accumulate(arrival - (work - burst))
+    np.maximum(slack, 0, out=slack)  # The clock starts at 0
+    ends = work + slack
+    return order, ends - burst, ends
+
+
+# Column names accepted in trace files, mapped to Workload fields
+COLUMN_ALIASES = {
+    "name": "name", "process": "name", "process_name": "name",
+    "arrival": "arrival", "arrival_time": "arrival",
+    "burst": "burst", "burst_time": "burst",
+    "priority": "priority",
+}
+
+
+def field_name(column):
+    """Workload field for a trace column name such as "Arrival Time"."""
+    column = column.strip().lower().replace(" ", "_")
+    return COLUMN_ALIASES.get(column, column)
+
+
+def as_integer(value):
+    """Checked int conversion for trace values.
+
+    Accepts ints, whole floats and their string forms; anything else,
+    including None, booleans and fractions such as 1.7, raises ValueError.
+    """
+    if isinstance(value, bool) or value is None:
+        raise ValueError(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            value = float(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise ValueError(value)
+
+
+def chunked(rows, chunk_size):
+    """Group an iterable of rows into lists of at most chunk_size rows."""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def csv_rows(path):
+    """Yield one dict per data row of a CSV trace, keyed by Workload field.
+
+    Every row has every header column.
+    """
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = [field_name(column) for column in next(reader, [])]
+        for row in reader:
+            if row:
+                # Short rows get None for their missing cells, which the parser rejects
+                yield dict(zip(header, row + [None] * (len(header) - len(row))))
+
+
+def jsonl_rows(path):
+    """Yield one dict per non-blank line of a JSONL trace."""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield {field_name(key): value for key, value in json.loads(line).items()}
+
+
+def column_chunks(rows, chunk_size=65536):
+    """Turn a row stream into chunks of column arrays.
+
+    Each chunk is a dict with int64 arrays for arrival, burst and (when the
+    trace has it) priority, plus a list of names when the trace names its
+    processes. The columns are those of the first row, which for a CSV
+    trace is the header; every row must have exactly those, or ValueError
+    names the first row that does not. Only one chunk of rows is held as
+    Python objects at a time.
+    """
+    fields = None
+    first_row = 1
+    for chunk in chunked(rows, chunk_size):
+        if fields is None:
+            fields = [field for field in ("arrival", "burst", "priority", "name") if field in chunk[0]]
+            for field in ("arrival", "burst"):
+                if field not in fields:
+                    raise ValueError(f"Trace has no '{field}' column.")
+        for field in ("priority", "name"):
+            if field not in fields:
+                for k, row in enumerate(chunk):
+                    if field in row:
+                        raise ValueError(f"Row {first_row + k} has a '{field}' column that the first row lacks.")
+
+        columns = {}
+        for field in fields:
+            if field == "name":
+                names = [row.get("name") for row in chunk]
+                if None in names:
+                    k = names.index(None)
+                    raise ValueError(f"Column 'name' must be present on every row; row {first_row + k} has none.")
+                columns["name"] = [str(name) for name in names]
+                continue
+            values = []
+            for k, row in enumerate(chunk):
+                try:
+                    values.append(as_integer(row[field]))
+                except (KeyError, ValueError):
+                    raise ValueError(f"Column '{field}' must hold an integer on every row; "
+                                     f"row {first_row + k} has {row.get(field)!r}.") from None
+            try:
+                columns[field] = np.array(values, dtype=np.int64)
+            except OverflowError:
+                raise ValueError(f"Column '{field}' has values out of range.") from None
+        first_row += len(chunk)
+        yield columns
+
+
+def workload_from_chunks(chunks):
+    """Concatenate column chunks into a single Workload."""
+    parts = {"arrival": [], "burst": [], "priority": [], "name": []}
+    for columns in chunks:
+        for field, values in columns.items():
+            parts[field].append(values)
+
+    if not parts["arrival"]:
+        raise ValueError("Trace has no processes.")
+    n_chunks = len(parts["arrival"])
+    if parts["priority"] and len(parts["priority"]) != n_chunks:
+        raise ValueError("Column 'priority' must be present on every row.")
+    if parts["name"] and len(parts["name"]) != n_chunks:
+        raise ValueError("Column 'name' must be present on every row.")
+
+    return Workload(
+        np.concatenate(parts["arrival"]),
+        np.concatenate(parts["burst"]),
+        np.concatenate(parts["priority"]) if parts["priority"] else None,
+        [name for names in parts["name"] for name in names] if parts["name"] else None,
+    )
+
+
+def load_workload(path, chunk_size=65536):
+    """Load a .csv or .jsonl trace file into a Workload."""
+    if str(path).lower().endswith((".jsonl", ".ndjson")):
+        rows = jsonl_rows(path)
+    else:
+        rows = csv_rows(path)
+    return workload_from_chunks(column_chunks(rows, chunk_size))